@@ -0,0 +1,35 @@
+import os
+import sys
+
+if getattr(sys, "frozen", False):
+    BASE_PATH = os.path.dirname(sys.executable)
+else:
+    BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+
+CORE_DIR = os.path.join(BASE_PATH, "CORE")
+ROMFS_DIR = os.path.join(BASE_PATH, "ROMFS")
+WORKSPACE_DIR = os.path.join(BASE_PATH, "workspace")
+OUTPUT_DIR = os.path.join(BASE_PATH, "output")
+
+REQUIRED_BEA_FILES = [
+    "bd~bd00.nx",
+    "bd~bd01.nx",
+    "bd~bd02.nx",
+    "bd~bd03.nx",
+    "bd~bd04.nx",
+    "bd~bd05.nx",
+    "bd~bd06.nx",
+    "bd~bd07.nx",
+]
+
+# Export outputs: linked mod-manager folders and/or one zip with every layout
+EXPORT_LAYOUT_FOLDERS = True
+EXPORT_ZIP_BUNDLE = False
+
+EXPECTED_CORE_CHECKSUMS = {
+    "a2cdc050aa73b3c0d29e790a8a0fd1df500cf524eab365d427df56c2303c1756": "1.0.0 <=> 2.2.0"
+}
+# Merkle root of the per-file SHA-256 (core_integrity.merkle_root) -> combined
+# checksum above; a listed root is recognized from per-file hashes alone (the
+# combined checksum is then not streamed). core_checksum prints unseen roots.
+EXPECTED_CORE_MERKLE_ROOTS = {}
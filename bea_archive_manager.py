@@ -1,24 +1,37 @@
 import os
 import appdirs
+import ctypes
 import sys
 import json
 import subprocess
 import tempfile
 import zipfile
+import fnmatch
 import platform
+import threading
+import time
 from pathlib import Path
 from contextlib import suppress
 
-from pythonnet import load  # pythonnet >= 3.x
-
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional
 import shutil
 from tqdm import tqdm
 
-import zstandard as zstd  # pip install zstandard
+import bea_codec
+from bea_cache import ExtractionCache
 import gc
 import io
 
+from bea_native import (
+    BeaArchive,
+    BeaFormatError,
+    extract_entries,
+    safe_rel_path as _safe_rel_path,
+    write_bea,
+    write_entries,
+)
+
 # FIX PyInstaller --windowed
 if not sys.stdin:
     sys.stdin = io.StringIO()
@@ -27,9 +40,10 @@ if not sys.stdout:
 if not sys.stderr:
     sys.stderr = io.StringIO()
 
-# Reusable Zstd decompressor
-_zstd_decompressor = zstd.ZstdDecompressor()
-_zstd_compression_level = 3  # reasonable level, adjust if needed
+# Zstd workers/level live in bea_codec (bea_codec.configure to change them)
+
+# Entry-level extraction tasks are cut at roughly this much uncompressed data
+_EXTRACT_TASK_BYTES = 32 * 1024 * 1024
 
 # ----------------------------------------------------------------------
 # .NET runtime initialization - FIXED
@@ -37,6 +51,8 @@ _zstd_compression_level = 3  # reasonable level, adjust if needed
 
 def init_dotnet_runtime():
     """Initialize .NET with complete system log suppression"""
+    from pythonnet import load  # pythonnet >= 3.x
+
     system = platform.system()
     
     try:
@@ -47,22 +63,57 @@ def init_dotnet_runtime():
     except Exception as e:
         raise RuntimeError(f".NET Runtime Initialization Failed: {e}")
 
-init_dotnet_runtime()
-import clr
-from System import Array, Byte, Activator, GC, Console
-from System.IO import FileStream, FileMode, FileAccess, FileShare, StringWriter
-
-# GLOBAL Console silencing - CORRECTED
-null_writer = StringWriter()
-Console.SetOut(null_writer)
-Console.SetError(null_writer)
+# Resolved by _ensure_bea_lib() on the first extract/repack that needs .NET
+BezelEngineArchive = None
+DOTNET_INIT_TIMINGS: Dict[str, float] = {}
+_dotnet_lock = threading.Lock()
+
+def _ensure_bea_lib():
+    """Boot the .NET runtime and load BezelEngineArchive_Lib once (thread-safe)"""
+    global BezelEngineArchive, clr, Array, Byte, Activator, GC, Console
+    global FileStream, FileMode, FileAccess, FileShare, StringWriter, IntPtr, Marshal
+    if BezelEngineArchive is not None:
+        return BezelEngineArchive
+
+    with _dotnet_lock:
+        if BezelEngineArchive is not None:
+            return BezelEngineArchive
+
+        start = time.perf_counter()
+        init_dotnet_runtime()
+        import clr
+        from System import Array, Byte, Activator, GC, Console, IntPtr
+        from System.IO import FileStream, FileMode, FileAccess, FileShare, StringWriter
+        from System.Runtime.InteropServices import Marshal
+
+        # GLOBAL Console silencing - CORRECTED
+        null_writer = StringWriter()
+        Console.SetOut(null_writer)
+        Console.SetError(null_writer)
+        runtime_ready = time.perf_counter()
+
+        bea_type = _init_bea_lib()
+        lib_ready = time.perf_counter()
+
+        DOTNET_INIT_TIMINGS["runtime"] = runtime_ready - start
+        DOTNET_INIT_TIMINGS["bea_lib"] = lib_ready - runtime_ready
+        print(
+            f"[INFO] .NET ready in {lib_ready - start:.2f}s "
+            f"(runtime {DOTNET_INIT_TIMINGS['runtime']:.2f}s, "
+            f"BezelEngineArchive_Lib {DOTNET_INIT_TIMINGS['bea_lib']:.2f}s)"
+        )
+        BezelEngineArchive = bea_type
+        return BezelEngineArchive
 
 # ----------------------------------------------------------------------
 # Silent wrapper for BEA operations - FIXED (no msvcrt/os.dup2)
 # ----------------------------------------------------------------------
 
 def silent_bea_operation(func, *args, **kwargs):
-    """Execute BEA operation with total log suppression - SIMPLIFIED"""
+    """Execute BEA operation with total log suppression - SIMPLIFIED
+
+    The .NET runtime must already be loaded (see _ensure_bea_lib).
+    """
     # Save/restore Console output only (no file descriptors)
     old_out = Console.Out
     old_err = Console.Error
@@ -105,10 +156,16 @@ else:
         BASE_LIB_DIR = CACHE_DIR / "libs"
         BASE_LIB_DIR.mkdir(parents=True, exist_ok=True)
 
+# Decompressed BEA entries, content-addressed by archive hash (LRU-bounded)
+EXTRACTION_CACHE = ExtractionCache(CACHE_DIR / "bea_entries")
+
 LIB_FOLDER_NAME = "BezelEngineArchive_Lib"
 BEA_LIB_ROOT = BASE_LIB_DIR / LIB_FOLDER_NAME
 BEA_DLL = BEA_LIB_ROOT / "BezelEngineArchive_Lib.dll"
 
+# Entries the editor actually reads (bd~bdXX.nx/bd/bdXX/data/*.json)
+EDITOR_DATA_PATTERNS = ["bd/*/data/*.json"]
+
 GITHUB_LATEST_API = "https://api.github.com/repos/KillzXGaming/BEA-Library-Editor/releases/latest"
 
 # ----------------------------------------------------------------------
@@ -264,27 +321,55 @@ def _init_bea_lib():
 
     return t
 
-BezelEngineArchive = _init_bea_lib()
-
 # ----------------------------------------------------------------------
 # .NET <-> Python helpers
 # ----------------------------------------------------------------------
 
+# pythonnet >= 3 exposes byte[] through the buffer protocol; older builds
+# fall back to Marshal.Copy. Either way a transfer is a single memcpy.
+_net_buffer_protocol = None
+
+def _net_array_has_buffer(arr) -> bool:
+    global _net_buffer_protocol
+    if _net_buffer_protocol is None:
+        try:
+            memoryview(arr).release()
+            _net_buffer_protocol = True
+        except TypeError:
+            _net_buffer_protocol = False
+    return _net_buffer_protocol
+
 def _net_bytes_to_py(data_net) -> bytes:
     if data_net is None:
         return b""
-    return bytes(bytearray(data_net))
-
-def _py_bytes_to_net(data: bytes):
-    return Array[Byte](list(data))
-
-def _safe_rel_path(name: str) -> str:
-    rel = name.replace("\\", "/")
-    while "../" in rel:
-        rel = rel.replace("../", "")
-    while "..\\" in rel:
-        rel = rel.replace("..\\", "")
-    return rel.lstrip("/")
+    length = int(data_net.Length)
+    if _net_array_has_buffer(data_net):
+        with memoryview(data_net) as view:
+            return view.tobytes()
+    buf = bytearray(length)
+    if length:
+        address = ctypes.addressof((ctypes.c_char * length).from_buffer(buf))
+        Marshal.Copy(data_net, 0, IntPtr(address), length)
+    return bytes(buf)
+
+def _py_bytes_to_net(data) -> "Array[Byte]":
+    length = len(data)
+    arr = Array.CreateInstance(Byte, length)
+    if not length:
+        return arr
+    if _net_array_has_buffer(arr):
+        with memoryview(arr) as view:
+            view.cast("B")[:] = data
+        return arr
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    address = ctypes.cast(ctypes.c_char_p(data), ctypes.c_void_p).value
+    Marshal.Copy(IntPtr(address), arr, 0, length)
+    return arr
+
+def _name_matches(name: str, patterns: List[str]) -> bool:
+    name = name.replace("\\", "/")
+    return any(name == p or fnmatch.fnmatchcase(name, p) for p in patterns)
 
 # ----------------------------------------------------------------------
 # ASST compression helpers (Zstd)
@@ -298,10 +383,7 @@ def _extract_entry_to_file(entry, dest_path: Path):
 
     if _is_entry_compressed(entry):
         usize = getattr(entry, "UncompressedSize", None)
-        if usize is not None and int(usize) > 0:
-            data = _zstd_decompressor.decompress(data_comp, max_output_size=int(usize))
-        else:
-            data = _zstd_decompressor.decompress(data_comp)
+        data = bea_codec.decompress(data_comp, int(usize or 0))
     else:
         data = data_comp
 
@@ -309,12 +391,13 @@ def _extract_entry_to_file(entry, dest_path: Path):
     with open(dest_path, "wb") as f:
         f.write(data)
 
-def _set_entry_from_uncompressed(entry, data: bytes):
+def _set_entry_from_uncompressed(entry, data: bytes, data_comp: Optional[bytes] = None):
+    """data_comp: payload already compressed by the batched codec stage"""
     raw_len = len(data)
 
     if _is_entry_compressed(entry):
-        cctx = zstd.ZstdCompressor(level=_zstd_compression_level)
-        data_comp = cctx.compress(data)
+        if data_comp is None:
+            data_comp = bea_codec.compress(data)
         entry.FileData = _py_bytes_to_net(data_comp)
 
         if hasattr(entry, "FileSize"):
@@ -332,15 +415,62 @@ def _set_entry_from_uncompressed(entry, data: bytes):
         if hasattr(entry, "IsCompressed"):
             entry.IsCompressed = False
 
+def _unchanged_entries(template_bea: Path, candidates: Dict[str, bytes]) -> set:
+    """Names (safe rel paths) whose content equals the template's decompressed entry.
+
+    Sizes are compared first so only same-size entries are decompressed and
+    compared. Unreadable templates report nothing as unchanged.
+    """
+    unchanged = set()
+    try:
+        archive = BeaArchive(template_bea, EXTRACTION_CACHE)
+    except BeaFormatError:
+        return unchanged
+    with archive:
+        for entry in archive:
+            rel = _safe_rel_path(entry.name)
+            data = candidates.get(rel)
+            if data is None or len(data) != entry.uncompressed_size:
+                continue
+            if data == archive.read(entry.name):
+                unchanged.add(rel)
+    return unchanged
+
 # ----------------------------------------------------------------------
 # Extraction / repack via BezelEngineArchive_Lib - SILENT
 # ----------------------------------------------------------------------
 
 def extract_bea(bea_path: str, out_dir: str) -> None:
+    """Extract every entry, natively when possible, else through the .NET library"""
+    extract_bea_entries(bea_path, out_dir, None)
+
+def extract_bea_entries(bea_path: str, out_dir: str, patterns: Optional[Iterable[str]]) -> List[str]:
+    """Extract only the entries matching names or globs (e.g. 'bd/bd00/data/*.json').
+
+    patterns=None extracts everything. Returns the extracted entry names.
+    """
+    if patterns is not None:
+        patterns = list(patterns)
+    try:
+        archive = BeaArchive(bea_path, EXTRACTION_CACHE)
+    except BeaFormatError as e:
+        print(f"[WARN] Native BEA reader failed on {bea_path} ({e}), using BezelEngineArchive_Lib")
+        return _extract_bea_dotnet(bea_path, out_dir, patterns)
+
+    with archive:
+        entries = list(archive) if patterns is None else archive.select(patterns)
+        Path(out_dir).resolve().mkdir(parents=True, exist_ok=True)
+        write_entries(archive, entries, out_dir)
+        return [entry.name for entry in entries]
+
+def _extract_bea_dotnet(bea_path: str, out_dir: str, patterns: Optional[List[str]] = None) -> List[str]:
+    _ensure_bea_lib()
+
     def _extract_silent():
         bea_path_p = Path(bea_path).resolve()
         out_dir_p = Path(out_dir).resolve()
         out_dir_p.mkdir(parents=True, exist_ok=True)
+        extracted = []
         
         bea = Activator.CreateInstance(BezelEngineArchive, str(bea_path_p))
         try:
@@ -348,11 +478,15 @@ def extract_bea(bea_path: str, out_dir: str) -> None:
             for kv in file_dict:
                 entry = kv.Value
                 name = str(entry.FileName)
+                if patterns is not None and not _name_matches(name, patterns):
+                    continue
                 rel = _safe_rel_path(name)
                 dest = out_dir_p / rel
                 if entry.FileData is None:
                     continue
                 _extract_entry_to_file(entry, dest)
+                extracted.append(name)
+            return extracted
         finally:
             if hasattr(bea, "Dispose"):
                 with suppress(Exception):
@@ -361,10 +495,33 @@ def extract_bea(bea_path: str, out_dir: str) -> None:
             GC.WaitForPendingFinalizers()
             gc.collect()
     
-    silent_bea_operation(_extract_silent)
+    return silent_bea_operation(_extract_silent)
+
+def _repack_native(template_bea: str, out_bea: str, replacements: Dict[str, bytes]) -> List[str]:
+    """Pure-Python repack (bea_native.write_bea), keyed by safe rel paths"""
+    with BeaArchive(template_bea) as archive:
+        names = {_safe_rel_path(name): name for name in archive.names()}
+    by_name = {names.get(rel, rel): data for rel, data in replacements.items()}
+    Path(out_bea).resolve().parent.mkdir(parents=True, exist_ok=True)
+    unknown = write_bea(template_bea, out_bea, by_name, EXTRACTION_CACHE)
+    return [_safe_rel_path(name) for name in unknown]
 
 def repack_bea_from_folder(input_dir: str, template_bea: str, out_bea: str, work_root: str) -> None:
+    """Repack template_bea with every entry present in input_dir"""
+    input_dir_p = Path(input_dir).resolve()
+    try:
+        with BeaArchive(template_bea) as archive:
+            rels = [_safe_rel_path(name) for name in archive.names()]
+        replacements = {rel: (input_dir_p / rel).read_bytes() for rel in rels if (input_dir_p / rel).is_file()}
+        _repack_native(template_bea, out_bea, replacements)
+    except BeaFormatError as e:
+        print(f"[WARN] Native BEA writer failed on {template_bea} ({e}), using BezelEngineArchive_Lib")
+        _repack_bea_from_folder_dotnet(input_dir, template_bea, out_bea, work_root)
+
+def _repack_bea_from_folder_dotnet(input_dir: str, template_bea: str, out_bea: str, work_root: str) -> None:
     """Safe repack with complete DLL log suppression"""
+    _ensure_bea_lib()
+
     def _repack_silent():
         input_dir_p = Path(input_dir).resolve()
         template_bea_p = Path(template_bea).resolve()
@@ -380,6 +537,7 @@ def repack_bea_from_folder(input_dir: str, template_bea: str, out_bea: str, work
         bea = Activator.CreateInstance(BezelEngineArchive, str(work_bea))
         try:
             file_dict = bea.FileList
+            candidates = {}
             for kv in file_dict:
                 entry = kv.Value
                 name = str(entry.FileName)
@@ -387,8 +545,20 @@ def repack_bea_from_folder(input_dir: str, template_bea: str, out_bea: str, work
                 src = input_dir_p / rel
                 if not src.is_file():
                     continue
-                data = src.read_bytes()
-                _set_entry_from_uncompressed(entry, data)
+                candidates[rel] = (entry, src.read_bytes())
+
+            # Untouched files keep their original compressed payload
+            unchanged = _unchanged_entries(
+                template_bea_p, {rel: data for rel, (entry, data) in candidates.items()}
+            )
+            updates = [item for rel, item in candidates.items() if rel not in unchanged]
+
+            # Batched codec stage: compress every entry on the thread pool
+            to_compress = [data for entry, data in updates if _is_entry_compressed(entry)]
+            compressed = iter(bea_codec.compress_many(to_compress))
+            for entry, data in updates:
+                data_comp = next(compressed) if _is_entry_compressed(entry) else None
+                _set_entry_from_uncompressed(entry, data, data_comp)
             
             tmp_out = out_bea_p.with_suffix(out_bea_p.suffix + ".tmp")
             fs_out = FileStream(str(tmp_out), FileMode.Create, FileAccess.Write, FileShare.Read)
@@ -414,35 +584,166 @@ def repack_bea_from_folder(input_dir: str, template_bea: str, out_bea: str, work
     
     silent_bea_operation(_repack_silent)
 
+def repack_bea_entries(template_bea: str, out_bea: str, replacements: Dict[str, bytes]) -> List[str]:
+    """Repack template_bea into out_bea, replacing only the given entries in memory.
+
+    replacements maps archive-relative names to uncompressed content. Every
+    other entry keeps its original compressed payload. Returns the names that
+    do not exist in the archive (and were therefore not written).
+    """
+    try:
+        return _repack_native(template_bea, out_bea, replacements)
+    except BeaFormatError as e:
+        print(f"[WARN] Native BEA writer failed on {template_bea} ({e}), using BezelEngineArchive_Lib")
+        return _repack_bea_entries_dotnet(template_bea, out_bea, replacements)
+
+def _repack_bea_entries_dotnet(template_bea: str, out_bea: str, replacements: Dict[str, bytes]) -> List[str]:
+    _ensure_bea_lib()
+
+    def _repack_silent():
+        template_bea_p = Path(template_bea).resolve()
+        out_bea_p = Path(out_bea).resolve()
+        out_bea_p.parent.mkdir(parents=True, exist_ok=True)
+        pending = {_safe_rel_path(name): data for name, data in replacements.items()}
+        unchanged = _unchanged_entries(template_bea_p, pending)
+
+        bea = Activator.CreateInstance(BezelEngineArchive, str(template_bea_p))
+        try:
+            updates = []
+            for kv in bea.FileList:
+                entry = kv.Value
+                rel = _safe_rel_path(str(entry.FileName))
+                if rel in pending:
+                    data = pending.pop(rel)
+                    if rel not in unchanged:
+                        updates.append((entry, data))
+
+            to_compress = [data for entry, data in updates if _is_entry_compressed(entry)]
+            compressed = iter(bea_codec.compress_many(to_compress))
+            for entry, data in updates:
+                data_comp = next(compressed) if _is_entry_compressed(entry) else None
+                _set_entry_from_uncompressed(entry, data, data_comp)
+
+            tmp_out = out_bea_p.with_suffix(out_bea_p.suffix + ".tmp")
+            fs_out = FileStream(str(tmp_out), FileMode.Create, FileAccess.Write, FileShare.Read)
+            try:
+                bea.Save(fs_out, False)
+            finally:
+                fs_out.Close()
+        finally:
+            if hasattr(bea, "Dispose"):
+                with suppress(Exception):
+                    bea.Dispose()
+            GC.Collect()
+            GC.WaitForPendingFinalizers()
+            gc.collect()
+
+        tmp_out.replace(out_bea_p)
+        return list(pending)
+
+    return silent_bea_operation(_repack_silent)
+
 # ----------------------------------------------------------------------
 # High-level functions (Python prints preserved)
 # ----------------------------------------------------------------------
 
-def bea_archives_extractor(base_path, bea_files):
+def _plan_extraction_tasks(bea_path: Path, output_dir: Path, patterns) -> List[tuple]:
+    """Split one archive into entry-level tasks of about _EXTRACT_TASK_BYTES each"""
+    with BeaArchive(bea_path) as archive:
+        entries = list(archive) if patterns is None else archive.select(patterns)
+
+    tasks = []
+    # Workers only look entries up in the cache when the archive is already
+    # fingerprinted there (see write_entries): no serial hashing pass here
+    cache_root = str(EXTRACTION_CACHE.root)
+    names, size = [], 0
+    for entry in entries:
+        names.append(entry.name)
+        size += entry.uncompressed_size or entry.size
+        if size >= _EXTRACT_TASK_BYTES:
+            tasks.append((str(bea_path), str(output_dir), names, cache_root))
+            names, size = [], 0
+    if names:
+        tasks.append((str(bea_path), str(output_dir), names, cache_root))
+    return tasks
+
+def bea_archives_extractor(base_path, bea_files, patterns=None, workers=None):
+    """Extract bea_files into CORE, optionally only the entries matching patterns.
+
+    Archives are split into entry-level tasks and fanned out across a process
+    pool of `workers` processes (default: one per core, 1 = sequential).
+    Returns 0 on success, 1 if a BEA file is missing, 2 on extraction error.
+    """
     base = Path(base_path).resolve()
     romfs = base / "ROMFS"
     core = base / "CORE"
+    workers = workers or os.cpu_count() or 1
 
     print("Extracting BEA files...")
-    for bea_file in tqdm(bea_files, desc="Extracting BEA files", unit="file", leave=True):
+    tasks = []
+    for bea_file in bea_files:
         full_bea_path = romfs / "Archive" / f"{bea_file}.bea"
         if not full_bea_path.is_file():
             print(f"[ERR] Missing BEA file: {full_bea_path}")
             return 1
 
         output_dir = core / bea_file
+        output_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            extract_bea(str(full_bea_path), str(output_dir))
+            tasks.extend(_plan_extraction_tasks(full_bea_path, output_dir, patterns))
+        except BeaFormatError:
+            # Not readable natively: extract it here through the .NET library
+            try:
+                extract_bea_entries(str(full_bea_path), str(output_dir), patterns)
+            except Exception as e:
+                print(f"[ERR] Error during extraction of {full_bea_path}: {e}")
+                return 2
         except Exception as e:
             print(f"[ERR] Error during extraction of {full_bea_path}: {e}")
             return 2
 
+    total = sum(len(task[2]) for task in tasks)
+    try:
+        with tqdm(total=total, desc="Extracting BEA files", unit="entry", leave=True) as progress:
+            if workers <= 1 or len(tasks) <= 1:
+                for task in tasks:
+                    try:
+                        progress.update(extract_entries(*task))
+                    except Exception as e:
+                        print(f"[ERR] Error during extraction of {task[0]}: {e}")
+                        return 2
+                return 0
+
+            processes = min(workers, len(tasks))
+            with ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=bea_codec.configure_process_worker,
+                initargs=(processes,),
+            ) as pool:
+                futures = {pool.submit(extract_entries, *task): task for task in tasks}
+                for future in as_completed(futures):
+                    try:
+                        progress.update(future.result())
+                    except Exception as e:
+                        print(f"[ERR] Error during extraction of {futures[future][0]}: {e}")
+                        for pending in futures:
+                            pending.cancel()
+                        return 2
+    finally:
+        EXTRACTION_CACHE.trim()
+
     return 0
 
 def bea_archives_repacker(
     instructions: Dict[str, List[Dict]], BASE_PATH: str, OUTPUT_DIR: str
 ):
+    """Write repacked copies of the touched ROMFS archives into OUTPUT_DIR/romfs/Archive.
+
+    Each template is opened once and only the entries listed in its
+    instructions ({"source": file, "destination": inner path}) are replaced.
+    Returns 0 on success, 2 on error.
+    """
     BASE_PATH = Path(BASE_PATH).resolve()
     OUTPUT_DIR = Path(OUTPUT_DIR).resolve()
 
@@ -450,71 +751,36 @@ def bea_archives_repacker(
     out_archive_dir = OUTPUT_DIR / "romfs" / "Archive"
     out_archive_dir.mkdir(parents=True, exist_ok=True)
 
-    print("Copying BEA files to output directory...")
-    for file in tqdm(list(instructions.keys()), desc="Copying BEA files", unit="file", leave=True):
+    print("Repacking BEA files...")
+    for file in tqdm(list(instructions.keys()), desc="Repacking BEA files", unit="file", leave=True):
         src_bea = romfs_dir / "Archive" / f"{file}.bea"
         if not src_bea.is_file():
-            print(f"[ERR] Missing BEA file for copy: {src_bea}")
+            print(f"[ERR] Missing BEA file: {src_bea}")
             return 2
 
-        dst_bea = out_archive_dir / f"{file}.bea"
-        try:
-            shutil.copy(str(src_bea), str(dst_bea))
-        except Exception as e:
-            print(f"[ERR] Error copying {src_bea} to {dst_bea}: {e}")
-            return 2
-
-    print("Modifying BEA files with BezelEngineArchive_Lib...")
-
-    # Temp root for extracted content
-    tmp_root = OUTPUT_DIR / "_bea_tmp"
-    tmp_root.mkdir(parents=True, exist_ok=True)
-
-    # System temp dir for .work files
-    work_root = Path(tempfile.mkdtemp(prefix="bea_work_"))
+        replacements = {}
+        for files_instruction in instructions[file]:
+            dest_rel = _safe_rel_path(files_instruction["destination"])
+            src_path = Path(files_instruction["source"]).resolve()
 
-    try:
-        for file in tqdm(list(instructions.keys()), desc="Repacking BEA files", unit="file", leave=True):
-            bea_path = out_archive_dir / f"{file}.bea"
-            tmp_dir = tmp_root / file
-
-            try:
-                extract_bea(str(bea_path), str(tmp_dir))
-            except Exception as e:
-                print(f"[ERR] Error extracting {bea_path}: {e}")
+            if not src_path.is_file():
+                print(f"[ERR] Missing source file: {src_path}")
                 return 2
-
-            for files_instruction in instructions[file]:
-                dest_rel = _safe_rel_path(files_instruction["destination"])
-                src_path = Path(files_instruction["source"]).resolve()
-
-                if not src_path.is_file():
-                    print(f"[ERR] Missing source file: {src_path}")
-                    return 2
-
-                dest_path = tmp_dir / dest_rel
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                try:
-                    shutil.copy(str(src_path), str(dest_path))
-                except Exception as e:
-                    print(f"[ERR] Error replacing {dest_rel}: {e}")
-                    return 2
-
             try:
-                repack_bea_from_folder(str(tmp_dir), str(bea_path), str(bea_path), str(work_root))
+                replacements[dest_rel] = src_path.read_bytes()
             except Exception as e:
-                print(f"[ERR] Error repacking {bea_path}: {e}")
+                print(f"[ERR] Error reading {src_path}: {e}")
                 return 2
 
-    finally:
-        # Cleanup temp directories
-        try:
-            shutil.rmtree(tmp_root)
-        except Exception:
-            pass
+        dst_bea = out_archive_dir / f"{file}.bea"
         try:
-            shutil.rmtree(work_root)
-        except Exception:
-            pass
+            unknown = repack_bea_entries(str(src_bea), str(dst_bea), replacements)
+        except Exception as e:
+            print(f"[ERR] Error repacking {src_bea}: {e}")
+            return 2
+
+        for name in unknown:
+            print(f"[WARN] {name} is not part of {file}.bea, skipped")
 
+    EXTRACTION_CACHE.trim()
     return 0
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+# Default size bound for decompressed entries kept on disk
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def hash_file(path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                sha256.update(mm)
+    return sha256.hexdigest()
+
+
+class ExtractionCache:
+    """Persistent cache of decompressed BEA entries.
+
+    Entries are content-addressed by the SHA-256 of their archive and their
+    name, so a modified or replaced archive never serves stale data. Archive
+    hashes are memoized by (size, mtime) so unchanged archives are hashed once;
+    each archive has its own fingerprint file, so concurrent processes never
+    rewrite a shared one.
+    Least recently used entries are evicted by trim() once the cache exceeds
+    max_bytes (an entry's mtime is its last use).
+    """
+
+    def __init__(self, root, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._objects = self.root / "objects"
+        self._fingerprints_dir = self.root / "archives"
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Archive keys
+    # ------------------------------------------------------------------
+
+    def _fingerprint_path(self, path: Path) -> Path:
+        name_hash = hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:32]
+        return self._fingerprints_dir / f"{name_hash}.json"
+
+    def _load_fingerprint(self, path: Path) -> Optional[list]:
+        with self._lock:
+            known = self._fingerprints.get(str(path))
+        if known is not None:
+            return known
+        try:
+            with open(self._fingerprint_path(path), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_fingerprint(self, path: Path, fingerprint: list) -> None:
+        with self._lock:
+            self._fingerprints[str(path)] = fingerprint
+        fingerprint_path = self._fingerprint_path(path)
+        try:
+            fingerprint_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = fingerprint_path.with_name(
+                f"{fingerprint_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(fingerprint, f)
+            os.replace(tmp, fingerprint_path)
+        except OSError as e:
+            print(f"[WARN] Could not write archive fingerprint {fingerprint_path}: {e}")
+
+    def known_archive_key(self, path) -> Optional[str]:
+        """Key of an archive already fingerprinted at its current size and mtime, else None"""
+        path = Path(path).resolve()
+        stat = path.stat()
+        known = self._load_fingerprint(path)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            with self._lock:
+                self._fingerprints[str(path)] = known
+            return known[2]
+        return None
+
+    def archive_key(self, path) -> str:
+        key = self.known_archive_key(path)
+        if key is not None:
+            return key
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = hash_file(path)
+        self._save_fingerprint(path, [stat.st_size, stat.st_mtime_ns, key])
+        return key
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def _entry_path(self, key: str, name: str) -> Path:
+        name_hash = hashlib.sha256(name.encode("utf-8")).hexdigest()[:32]
+        return self._objects / key[:2] / key / name_hash
+
+    def get(self, key: str, name: str) -> Optional[bytes]:
+        path = self._entry_path(key, name)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, name: str, data) -> None:
+        path = self._entry_path(key, name)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[WARN] Could not write extraction cache entry {path}: {e}")
+
+    def trim(self) -> None:
+        """Evict least recently used entries until the cache fits max_bytes"""
+        if not self._objects.is_dir():
+            return
+        files = []
+        total = 0
+        for root, _, names in os.walk(self._objects):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime_ns, stat.st_size, path))
+                total += stat.st_size
+
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
@@ -0,0 +1,121 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+import zstandard as zstd  # pip install zstandard
+
+# ----------------------------------------------------------------------
+# Settings
+# ----------------------------------------------------------------------
+
+# Worker threads for the codec stage (zstandard releases the GIL)
+ZSTD_WORKERS = os.cpu_count() or 1
+# Compression level used for repacked ASST entries
+ZSTD_LEVEL = 3
+
+_local = threading.local()
+# Shared codec threads, created on first use with one thread per core and
+# never resized; ZSTD_WORKERS / workers bound how many a call keeps busy
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def configure(workers: Optional[int] = None, level: Optional[int] = None) -> None:
+    global ZSTD_WORKERS, ZSTD_LEVEL
+    if workers is not None:
+        ZSTD_WORKERS = max(1, int(workers))
+    if level is not None:
+        ZSTD_LEVEL = int(level)
+
+
+def configure_process_worker(processes: int) -> None:
+    """Process pool initializer: share the cores between the worker processes.
+
+    Without it every process would run os.cpu_count() codec threads.
+    """
+    configure(workers=max(1, (os.cpu_count() or 1) // max(1, processes)))
+
+
+def _reset_after_fork() -> None:
+    # The parent's threads do not exist in a forked child
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+# ----------------------------------------------------------------------
+# Per-thread contexts (one compressor per level, one decompressor)
+# ----------------------------------------------------------------------
+
+def _compressor(level: int) -> zstd.ZstdCompressor:
+    cctxs = getattr(_local, "cctxs", None)
+    if cctxs is None:
+        cctxs = _local.cctxs = {}
+    cctx = cctxs.get(level)
+    if cctx is None:
+        cctx = cctxs[level] = zstd.ZstdCompressor(level=level)
+    return cctx
+
+
+def _decompressor() -> zstd.ZstdDecompressor:
+    dctx = getattr(_local, "dctx", None)
+    if dctx is None:
+        dctx = _local.dctx = zstd.ZstdDecompressor()
+    return dctx
+
+
+def compress(data, level: Optional[int] = None) -> bytes:
+    return _compressor(ZSTD_LEVEL if level is None else level).compress(data)
+
+
+def decompress(data, uncompressed_size: int = 0) -> bytes:
+    if uncompressed_size > 0:
+        return _decompressor().decompress(data, max_output_size=uncompressed_size)
+    return _decompressor().decompress(data)
+
+
+# ----------------------------------------------------------------------
+# Batched stage
+# ----------------------------------------------------------------------
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="bea_codec"
+            )
+        return _executor
+
+
+def _run(func, items: list, workers: Optional[int]) -> list:
+    """func over items in order, with at most workers calls in flight"""
+    workers = ZSTD_WORKERS if workers is None else max(1, workers)
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    pool = _pool()
+    results = []
+    pending = deque()
+    for item in items:
+        if len(pending) >= workers:
+            results.append(pending.popleft().result())
+        pending.append(pool.submit(func, item))
+    results.extend(future.result() for future in pending)
+    return results
+
+
+def compress_many(datas: Iterable, level: Optional[int] = None, workers: Optional[int] = None) -> List[bytes]:
+    """Compress every buffer, preserving order"""
+    level = ZSTD_LEVEL if level is None else level
+    return _run(lambda data: _compressor(level).compress(data), list(datas), workers)
+
+
+def decompress_many(items: Iterable[Tuple[object, int]], workers: Optional[int] = None) -> List[bytes]:
+    """Decompress (data, uncompressed_size) pairs, preserving order"""
+    return _run(lambda item: decompress(*item), list(items), workers)
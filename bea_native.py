@@ -0,0 +1,463 @@
+import fnmatch
+import mmap
+import os
+import struct
+from contextlib import suppress
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import zstandard as zstd  # pip install zstandard
+
+import bea_codec
+
+# ----------------------------------------------------------------------
+# BEA binary layout (little-endian, as written by BezelEngineArchive_Lib)
+# ----------------------------------------------------------------------
+
+BEA_MAGIC = b"SCNE"
+ASST_MAGIC = b"ASST"
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# SCNE header
+_HDR_BOM = 0x0C             # u16, 0xFEFF when little-endian
+_HDR_ALIGNMENT = 0x0E       # u8, data alignment as a power of two
+_HDR_RLT_OFFSET = 0x18      # u32, relocation table offset
+_HDR_FILE_SIZE = 0x1C       # u32, total archive size
+_HDR_FILE_COUNT = 0x20      # u64
+_HDR_ASST_OFFSET = 0x28     # i64, first ASST record
+_HDR_DICT_OFFSET = 0x30     # i64, file name dictionary
+_HDR_NAME_OFFSET = 0x40     # i64, archive name string
+_HDR_SIZE = 0x48
+
+# ASST file records, stored contiguously after the header
+_ASST_FILE_SIZE = 0x14      # u32, stored (possibly compressed) size
+_ASST_RAW_SIZE = 0x18       # u32, uncompressed size
+_ASST_DATA_OFFSET = 0x20    # i64, payload offset
+_ASST_NAME_OFFSET = 0x28    # i64, file name string
+_ASST_SIZE = 0x30
+
+# _RLT relocation table: header, then sections of
+# (u64 pointer, u32 position, u32 size, u32 entry index, u32 entry count)
+RLT_MAGIC = b"_RLT"
+_RLT_POSITION = 0x04        # u32, offset of the table itself
+_RLT_SECTION_COUNT = 0x08   # u32
+_RLT_HEADER_SIZE = 0x10
+_RLT_SECTION_POSITION = 0x08
+_RLT_SECTION_SIZE = 0x0C
+_RLT_SECTION_STRIDE = 0x18
+_RLT_SECTION_ENTRY_INDEX = 0x10
+_RLT_SECTION_ENTRY_COUNT = 0x14
+# then entries of (u32 position, u16 struct count, u8 offset count, u8 padding)
+_RLT_ENTRY_STRIDE = 0x08
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+
+
+class BeaFormatError(ValueError):
+    pass
+
+
+class BeaEntry:
+    """File table entry, payload location only (no data is read)"""
+
+    __slots__ = ("name", "record_offset", "data_offset", "size", "uncompressed_size", "is_compressed")
+
+    def __init__(self, name, record_offset, data_offset, size, uncompressed_size, is_compressed):
+        self.name = name
+        self.record_offset = record_offset
+        self.data_offset = data_offset
+        self.size = size
+        self.uncompressed_size = uncompressed_size
+        self.is_compressed = is_compressed
+
+    def __repr__(self):
+        return f"BeaEntry({self.name!r}, size={self.size}, uncompressed_size={self.uncompressed_size})"
+
+
+class BeaArchive:
+    """Memory-mapped BEA archive.
+
+    Only the header and the file table are parsed on open. Entry payloads are
+    exposed as zero-copy memoryview slices over the mapping and decompressed
+    on demand.
+    """
+
+    def __init__(self, path, cache=None):
+        """cache: optional bea_cache.ExtractionCache for decompressed entries"""
+        self.path = Path(path)
+        self.cache = cache
+        self._cache_key = None
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise BeaFormatError(f"Empty BEA file: {self.path}")
+        self._view = memoryview(self._mm)
+        self.entries: Dict[str, BeaEntry] = {}
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+
+    def _read_string(self, offset: int) -> str:
+        if offset <= 0 or offset + 2 > len(self._mm):
+            raise BeaFormatError(f"String offset out of range: {offset:#x}")
+        (length,) = _U16.unpack_from(self._mm, offset)
+        end = offset + 2 + length
+        if end > len(self._mm):
+            raise BeaFormatError(f"String at {offset:#x} overruns the archive")
+        return bytes(self._view[offset + 2:end]).decode("utf-8")
+
+    def _parse(self):
+        mm = self._mm
+        if len(mm) < _HDR_SIZE or mm[0:4] != BEA_MAGIC:
+            raise BeaFormatError(f"Not a BEA archive (missing SCNE magic): {self.path}")
+        (bom,) = _U16.unpack_from(mm, _HDR_BOM)
+        if bom != 0xFEFF:
+            raise BeaFormatError(f"Unsupported byte order mark {bom:#06x}: {self.path}")
+
+        self.alignment = 1 << mm[_HDR_ALIGNMENT]
+        (self.rlt_offset,) = _U32.unpack_from(mm, _HDR_RLT_OFFSET)
+        (file_count,) = _U64.unpack_from(mm, _HDR_FILE_COUNT)
+        (asst_offset,) = _I64.unpack_from(mm, _HDR_ASST_OFFSET)
+        (name_offset,) = _I64.unpack_from(mm, _HDR_NAME_OFFSET)
+
+        if asst_offset <= 0 or asst_offset + file_count * _ASST_SIZE > len(mm):
+            raise BeaFormatError(f"File table out of range: {self.path}")
+
+        self.name = self._read_string(name_offset) if name_offset > 0 else ""
+
+        for index in range(file_count):
+            record = asst_offset + index * _ASST_SIZE
+            if mm[record:record + 4] != ASST_MAGIC:
+                raise BeaFormatError(f"Missing ASST magic at {record:#x}: {self.path}")
+            (size,) = _U32.unpack_from(mm, record + _ASST_FILE_SIZE)
+            (raw_size,) = _U32.unpack_from(mm, record + _ASST_RAW_SIZE)
+            (data_offset,) = _I64.unpack_from(mm, record + _ASST_DATA_OFFSET)
+            (entry_name_offset,) = _I64.unpack_from(mm, record + _ASST_NAME_OFFSET)
+            if data_offset < 0 or data_offset + size > len(mm):
+                raise BeaFormatError(f"Entry data out of range at {record:#x}: {self.path}")
+
+            name = self._read_string(entry_name_offset)
+            is_compressed = bytes(mm[data_offset:data_offset + 4]) == ZSTD_FRAME_MAGIC
+            self.entries[name] = BeaEntry(name, record, data_offset, size, raw_size, is_compressed)
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[BeaEntry]:
+        return iter(self.entries.values())
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def names(self) -> List[str]:
+        return list(self.entries)
+
+    def select(self, patterns: Iterable[str]) -> List[BeaEntry]:
+        """Entries whose name equals or glob-matches one of the patterns"""
+        patterns = [p.replace("\\", "/") for p in patterns]
+        exact = [p for p in patterns if not any(c in p for c in "*?[")]
+        globs = [p for p in patterns if p not in exact]
+        selected = []
+        for name, entry in self.entries.items():
+            if name in exact or any(fnmatch.fnmatchcase(name, g) for g in globs):
+                selected.append(entry)
+        return selected
+
+    @property
+    def cache_key(self) -> str:
+        if self._cache_key is None:
+            self._cache_key = self.cache.archive_key(self.path)
+        return self._cache_key
+
+    def known_cache_key(self) -> Optional[str]:
+        """cache_key if it is known without hashing the archive, else None"""
+        if self._cache_key is None and self.cache is not None:
+            self._cache_key = self.cache.known_archive_key(self.path)
+        return self._cache_key
+
+    def raw(self, name: str) -> memoryview:
+        """Stored payload of an entry, zero-copy (still compressed if it was)"""
+        entry = self.entries[name]
+        return self._view[entry.data_offset:entry.data_offset + entry.size]
+
+    def read(self, name: str, decompressor=None) -> bytes:
+        """Uncompressed content of an entry"""
+        entry = self.entries[name]
+        if entry.is_compressed and self.cache is not None:
+            cached = self.cache.get(self.cache_key, name)
+            if cached is not None:
+                return cached
+
+        data = self.raw(name)
+        try:
+            if not entry.is_compressed:
+                return bytes(data)
+            dctx = decompressor or zstd.ZstdDecompressor()
+            if entry.uncompressed_size > 0:
+                content = dctx.decompress(data, max_output_size=entry.uncompressed_size)
+            else:
+                content = dctx.decompress(data)
+        finally:
+            data.release()
+
+        if self.cache is not None:
+            self.cache.put(self.cache_key, name, content)
+        return content
+
+    # ------------------------------------------------------------------
+    # Lifetime
+    # ------------------------------------------------------------------
+
+    def close(self):
+        with suppress(BufferError):
+            self._view.release()
+        # Outstanding raw() views keep the mapping alive until they are released
+        with suppress(BufferError):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# ----------------------------------------------------------------------
+# Extraction helpers (importable by worker processes without .NET)
+# ----------------------------------------------------------------------
+
+def safe_rel_path(name: str) -> str:
+    rel = name.replace("\\", "/")
+    while "../" in rel:
+        rel = rel.replace("../", "")
+    while "..\\" in rel:
+        rel = rel.replace("..\\", "")
+    return rel.lstrip("/")
+
+
+def write_entries(archive: BeaArchive, entries: Iterable[BeaEntry], out_dir) -> int:
+    """Decompress entries on the codec thread pool and write them under out_dir.
+
+    Entries are served from the cache when the archive is already known to it
+    (never hashed here); the extracted files are the copy, so nothing is
+    added to the cache.
+    """
+    out_dir_p = Path(out_dir).resolve()
+    entries = list(entries)
+    cache_key = archive.known_cache_key()
+    cached = {}
+    if cache_key is not None:
+        for entry in entries:
+            if entry.is_compressed:
+                data = archive.cache.get(cache_key, entry.name)
+                if data is not None:
+                    cached[entry.name] = data
+
+    to_decompress = [e for e in entries if e.is_compressed and e.name not in cached]
+    views = {entry.name: archive.raw(entry.name) for entry in entries if entry.name not in cached}
+    try:
+        decompressed = dict(zip(
+            (entry.name for entry in to_decompress),
+            bea_codec.decompress_many((views[e.name], e.uncompressed_size) for e in to_decompress),
+        ))
+        datas = []
+        for entry in entries:
+            if entry.name in cached:
+                datas.append(cached[entry.name])
+            elif entry.name in decompressed:
+                datas.append(decompressed[entry.name])
+            else:
+                datas.append(bytes(views[entry.name]))
+    finally:
+        for view in views.values():
+            view.release()
+
+    for entry, data in zip(entries, datas):
+        dest = out_dir_p / safe_rel_path(entry.name)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with open(dest, "wb") as f:
+            f.write(data)
+    return len(entries)
+
+
+def extract_entries(bea_path: str, out_dir: str, names: List[str], cache_root=None) -> int:
+    """Extract the named entries of one archive (process pool task)"""
+    cache = None
+    if cache_root is not None:
+        from bea_cache import ExtractionCache
+
+        cache = ExtractionCache(cache_root)
+    with BeaArchive(bea_path, cache) as archive:
+        return write_entries(archive, (archive.entries[name] for name in names), out_dir)
+
+
+# ----------------------------------------------------------------------
+# Writer
+# ----------------------------------------------------------------------
+
+def _align(value: int, alignment: int) -> int:
+    return -(-value // alignment) * alignment
+
+
+def write_bea(template_path, out_path, replacements: Dict[str, bytes], cache=None) -> List[str]:
+    """Serialize template_path to out_path with some entries replaced.
+
+    replacements maps entry names to uncompressed content; entries compressed
+    in the template are zstd-compressed again. Everything before the first data
+    block (header, file table, strings, dictionary) is copied from the template
+    with the ASST sizes and offsets patched, data blocks are streamed in their
+    original order at the archive alignment, and the trailing relocation table
+    is shifted. Other layouts raise BeaFormatError. An archive with no
+    effective replacement is reproduced byte for byte. Returns the replacement
+    names that are not part of the archive.
+    """
+    out_path = Path(out_path)
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    with BeaArchive(template_path, cache) as archive:
+        unknown = [name for name in replacements if name not in archive.entries]
+        payloads = _replacement_payloads(archive, replacements)
+        _write_layout(archive, tmp_path, payloads)
+    os.replace(tmp_path, out_path)
+    return unknown
+
+
+def _replacement_payloads(archive: BeaArchive, replacements: Dict[str, bytes]) -> Dict[str, Tuple[bytes, int]]:
+    """Stored payload and uncompressed size for every entry that really changed"""
+    changed = {}
+    for name, data in replacements.items():
+        entry = archive.entries.get(name)
+        if entry is None:
+            continue
+        if len(data) == entry.uncompressed_size and data == archive.read(name):
+            continue  # passthrough: keep the original compressed bytes
+        changed[name] = data
+
+    compressed_names = [name for name in changed if archive.entries[name].is_compressed]
+    compressed = dict(zip(compressed_names, bea_codec.compress_many(changed[n] for n in compressed_names)))
+    return {name: (compressed.get(name, data), len(data)) for name, data in changed.items()}
+
+
+def _write_layout(archive: BeaArchive, path: Path, payloads: Dict[str, Tuple[bytes, int]]) -> None:
+    mm = archive._mm
+    alignment = archive.alignment
+    entries = sorted(archive, key=lambda e: e.data_offset)
+    if not entries:
+        with open(path, "wb") as f:
+            f.write(mm)
+        return
+
+    data_start = entries[0].data_offset
+    data_end = max(e.data_offset + e.size for e in entries)
+    _check_layout(archive, data_start, data_end)
+    prefix = bytearray(mm[:data_start])
+
+    # Place blocks: keep template offsets until a size change forces a shift
+    placed = []
+    cursor = data_start
+    delta = 0
+    for entry in entries:
+        stored, raw_size = payloads.get(entry.name, (None, entry.uncompressed_size))
+        size = entry.size if stored is None else len(stored)
+        offset = max(entry.data_offset + delta, _align(cursor, alignment))
+        delta = offset - entry.data_offset
+        placed.append((entry, offset, stored))
+        cursor = offset + size
+
+        record = entry.record_offset
+        _U32.pack_into(prefix, record + _ASST_FILE_SIZE, size)
+        _U32.pack_into(prefix, record + _ASST_RAW_SIZE, raw_size)
+        _I64.pack_into(prefix, record + _ASST_DATA_OFFSET, offset)
+
+    # Trailing data (relocation table) moves by a multiple of the alignment
+    shift = -((data_end - cursor) // alignment) * alignment
+    suffix = bytearray(mm[data_end:])
+    rlt = archive.rlt_offset
+    if rlt >= data_end:
+        _U32.pack_into(prefix, _HDR_RLT_OFFSET, rlt + shift)
+        _patch_relocation_table(suffix, rlt - data_end, data_end, shift)
+    _U32.pack_into(prefix, _HDR_FILE_SIZE, data_end + shift + len(suffix))
+
+    with open(path, "wb") as f:
+        f.write(prefix)
+        written = data_start
+        for entry, offset, stored in placed:
+            f.write(bytes(offset - written))
+            if stored is None:
+                view = archive.raw(entry.name)
+                try:
+                    f.write(view)
+                finally:
+                    view.release()
+                written = offset + entry.size
+            else:
+                f.write(stored)
+                written = offset + len(stored)
+        f.write(bytes(data_end + shift - written))
+        f.write(suffix)
+
+
+def _check_layout(archive: BeaArchive, data_start: int, data_end: int) -> None:
+    """Raise BeaFormatError unless the layout is the one _write_layout rewrites.
+
+    Only ASST data pointers may point at or past the first data block, and no
+    relocation entry may lie after the last one: anything else (strings or
+    dictionary after the data, pointers inside the suffix) would go stale.
+    """
+    mm = archive._mm
+    pointers = [("header", at) for at in (_HDR_ASST_OFFSET, _HDR_DICT_OFFSET, _HDR_NAME_OFFSET)]
+    pointers += [(entry.name, entry.record_offset + _ASST_NAME_OFFSET) for entry in archive]
+    for owner, at in pointers:
+        (target,) = _I64.unpack_from(mm, at)
+        if target >= data_start:
+            raise BeaFormatError(f"Unsupported layout: {owner} pointer {target:#x} after the data start")
+
+    rlt = archive.rlt_offset
+    if rlt < data_end or mm[rlt:rlt + 4] != RLT_MAGIC:
+        return
+    (count,) = _U32.unpack_from(mm, rlt + _RLT_SECTION_COUNT)
+    sections = rlt + _RLT_HEADER_SIZE
+    entry_count = 0
+    for index in range(count):
+        section = sections + index * _RLT_SECTION_STRIDE
+        (first,) = _U32.unpack_from(mm, section + _RLT_SECTION_ENTRY_INDEX)
+        (sec_entries,) = _U32.unpack_from(mm, section + _RLT_SECTION_ENTRY_COUNT)
+        entry_count = max(entry_count, first + sec_entries)
+    table = sections + count * _RLT_SECTION_STRIDE
+    if table + entry_count * _RLT_ENTRY_STRIDE > len(mm):
+        raise BeaFormatError(f"Relocation table out of range at {rlt:#x}")
+    for index in range(entry_count):
+        (position,) = _U32.unpack_from(mm, table + index * _RLT_ENTRY_STRIDE)
+        if position >= data_end:
+            raise BeaFormatError(f"Unsupported layout: relocation entry {position:#x} after the data")
+
+
+def _patch_relocation_table(buf: bytearray, at: int, data_end: int, shift: int) -> None:
+    if shift == 0 or buf[at:at + 4] != RLT_MAGIC:
+        return
+    (position,) = _U32.unpack_from(buf, at + _RLT_POSITION)
+    _U32.pack_into(buf, at + _RLT_POSITION, position + shift)
+    (count,) = _U32.unpack_from(buf, at + _RLT_SECTION_COUNT)
+    for index in range(count):
+        section = at + _RLT_HEADER_SIZE + index * _RLT_SECTION_STRIDE
+        (sec_pos,) = _U32.unpack_from(buf, section + _RLT_SECTION_POSITION)
+        (sec_size,) = _U32.unpack_from(buf, section + _RLT_SECTION_SIZE)
+        if sec_pos >= data_end:
+            _U32.pack_into(buf, section + _RLT_SECTION_POSITION, sec_pos + shift)
+        elif sec_pos + sec_size >= data_end:
+            _U32.pack_into(buf, section + _RLT_SECTION_SIZE, sec_size + shift)
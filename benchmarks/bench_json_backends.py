@@ -0,0 +1,104 @@
+"""Benchmark: stdlib json vs orjson parsing the board data files of CORE.
+
+Times parsing per file kind and backend, checking every backend returns the
+stdlib's documents, and the (stdlib) serialization with the options the save
+functions use. Needs an extracted CORE (defaults to app_config.CORE_DIR) and
+orjson installed for the comparison.
+
+    python benchmarks/bench_json_backends.py [core_dir] [repeat]
+"""
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json_codec  # noqa: E402
+
+# Options of the matching board_data save functions
+DUMP_KWARGS = {
+    "MapNode": {"indent": 4, "ensure_ascii": False},
+    "MapPath": {"indent": 4, "ensure_ascii": False},
+    "ItemShop": {"indent": 4, "ensure_ascii": False},
+}
+DEFAULT_DUMP_KWARGS = {"indent": 4}
+KIND = re.compile(r"bd\d\d_([A-Za-z]+)")
+
+
+def best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def board_files(core_dir):
+    """{kind: [raw bytes]} of the board data files of core_dir"""
+    files = defaultdict(list)
+    for root, _, names in os.walk(core_dir):
+        for name in names:
+            match = KIND.match(name)
+            if name.endswith(".json") and match:
+                with open(os.path.join(root, name), "rb") as f:
+                    files[match.group(1)].append(f.read())
+    return files
+
+
+def main():
+    if len(sys.argv) > 1:
+        core_dir = sys.argv[1]
+    else:
+        from app_config import CORE_DIR as core_dir
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    files = board_files(core_dir)
+    if not files:
+        print(f"[ERR] No board data files found in {core_dir}")
+        return 1
+    print(f"backends: {json_codec.BACKENDS}")
+    if "orjson" not in json_codec.BACKENDS:
+        print("[WARN] orjson is not installed, only the stdlib is measured")
+
+    print(
+        f"{'kind':<12} | {'files':>5} | {'KiB':>7} | {'backend':<8} | "
+        f"{'parse (ms)':>10} | {'identical':>9}"
+    )
+    totals = defaultdict(float)
+    dump_total = 0.0
+    for kind in sorted(files):
+        raws = files[kind]
+        size = sum(len(raw) for raw in raws) / 1024
+        kwargs = DUMP_KWARGS.get(kind, DEFAULT_DUMP_KWARGS)
+        json_codec.use_backend("json")
+        documents = [json_codec.loads(raw) for raw in raws]
+
+        for backend in json_codec.BACKENDS:
+            json_codec.use_backend(backend)
+            parse = best_of(lambda: [json_codec.loads(raw) for raw in raws], repeat)
+            identical = all(
+                json_codec.loads(raw) == document for raw, document in zip(raws, documents)
+            )
+            totals[backend] += parse
+            print(
+                f"{kind:<12} | {len(raws):>5} | {size:>7.1f} | {backend:<8} | "
+                f"{parse * 1000:>10.2f} | {str(identical):>9}"
+            )
+        dump_total += best_of(
+            lambda: [json_codec.dumps_bytes(document, **kwargs) for document in documents],
+            repeat,
+        )
+
+    print()
+    base_parse = totals["json"]
+    for backend, parse in totals.items():
+        print(f"{backend:<8} total: parse {parse * 1000:.2f} ms ({base_parse / parse:.1f}x)")
+    print(f"dump (json) total: {dump_total * 1000:.2f} ms")
+    json_codec.use_backend(json_codec.BACKENDS[0])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
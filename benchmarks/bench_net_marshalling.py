@@ -0,0 +1,61 @@
+"""Micro-benchmark: Python <-> .NET byte[] transfer helpers.
+
+Compares the list-based helpers previously used by bea_archive_manager with
+the current single-copy ones. Needs the .NET runtime (pythonnet + CoreCLR on
+Windows, Mono elsewhere).
+
+    python benchmarks/bench_net_marshalling.py [repeat]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bea_archive_manager as bam  # noqa: E402
+
+SIZES = [64 * 1024, 1024 * 1024, 8 * 1024 * 1024]
+
+
+def legacy_py_bytes_to_net(data):
+    return bam.Array[bam.Byte](list(data))
+
+
+def legacy_net_bytes_to_py(data_net):
+    return bytes(bytearray(data_net))
+
+
+def best_of(func, arg, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    bam._ensure_bea_lib()
+    print(f"buffer protocol on byte[]: {bam._net_array_has_buffer(bam.Array.CreateInstance(bam.Byte, 1))}")
+    print(f"{'size':>10} | {'direction':<10} | {'legacy (ms)':>12} | {'current (ms)':>12} | {'speedup':>8}")
+    for size in SIZES:
+        data = os.urandom(size)
+        data_net = bam._py_bytes_to_net(data)
+        assert bam._net_bytes_to_py(data_net) == data
+
+        rows = [
+            ("py->net", legacy_py_bytes_to_net, bam._py_bytes_to_net, data),
+            ("net->py", legacy_net_bytes_to_py, bam._net_bytes_to_py, data_net),
+        ]
+        for direction, legacy, current, arg in rows:
+            t_legacy = best_of(legacy, arg, repeat)
+            t_current = best_of(current, arg, repeat)
+            print(
+                f"{size:>10} | {direction:<10} | {t_legacy * 1000:>12.2f} | "
+                f"{t_current * 1000:>12.2f} | {t_legacy / t_current:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
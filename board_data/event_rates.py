@@ -0,0 +1,94 @@
+import numpy as np
+
+from board_data.events import event_result_options
+
+EVENT_RATES = ["Rate0", "Rate1", "Rate2", "Rate3"]
+EVENT_ENTRIES = 8
+
+# Defaults: every rate column sums to 50..100 and no entry exceeds a third of
+# the table (the cap of the first draw of the legacy sequential randomizer)
+MIN_COLUMN_TOTAL = 50
+MAX_COLUMN_TOTAL = 100
+MIN_RATE = 0
+MAX_RATE = 100 // 3
+
+
+def _bounded_multinomial(gen, totals, pvals, caps):
+    """Integers summing to totals along the last axis, drawn ~ pvals, each <= caps.
+
+    Overflow above a cap is redrawn over the entries still below it, which
+    terminates because totals never exceed the summed caps. Only overflowing
+    rows are redrawn: a row whose total equals its summed caps ends with no
+    open entry and nothing left to place.
+    """
+    counts = gen.multinomial(totals, pvals)
+    for _ in range(pvals.shape[-1]):
+        excess = np.maximum(counts - caps, 0)
+        overflow = excess.sum(axis=-1)
+        rows = overflow > 0
+        if not rows.any():
+            break
+        counts -= excess
+        open_slots = counts[rows] < caps
+        weights = np.where(open_slots, pvals[rows], 0.0)
+        weight_sum = weights.sum(axis=-1, keepdims=True)
+        # Rows whose weighted entries are all capped spread evenly over open ones
+        weights = np.where(weight_sum > 0, weights, open_slots.astype(float))
+        weights /= weights.sum(axis=-1, keepdims=True)
+        counts[rows] += gen.multinomial(overflow[rows], weights)
+    return counts
+
+
+def sample_rate_tables(
+    count,
+    entries=EVENT_ENTRIES,
+    gen=None,
+    min_total=MIN_COLUMN_TOTAL,
+    max_total=MAX_COLUMN_TOTAL,
+    min_rate=MIN_RATE,
+    max_rate=MAX_RATE,
+    alpha=1.0,
+):
+    """Draw count rate tables at once: int array (count, entries, len(EVENT_RATES)).
+
+    Each column total is uniform in [min_total, max_total] and split between
+    entries with Dirichlet(alpha) weights, so every column is non-zero and
+    every rate lies in [min_rate, max_rate] by construction.
+    """
+    if min_total < 1 or min_total > max_total:
+        raise ValueError("Column totals must satisfy 1 <= min_total <= max_total")
+    if entries * min_rate > min_total or entries * max_rate < max_total:
+        raise ValueError("Rate bounds cannot reach the requested column totals")
+    gen = gen if gen is not None else np.random.default_rng()
+
+    shape = (count, len(EVENT_RATES))
+    totals = gen.integers(min_total, max_total, size=shape, endpoint=True)
+    weights = gen.dirichlet(np.full(entries, alpha), size=shape)
+    counts = min_rate + _bounded_multinomial(
+        gen, totals - entries * min_rate, weights, max_rate - min_rate
+    )
+    # (count, rate, entry) -> (count, entry, rate)
+    return counts.transpose(0, 2, 1)
+
+
+def sample_event_tables(map_name, data_type, count, gen=None, **bounds):
+    """count event tables (lists of {"Rate0".."Rate3", "Result"}) for map_name.
+
+    Each table holds EVENT_ENTRIES distinct results of the map's options.
+    """
+    gen = gen if gen is not None else np.random.default_rng()
+    options = event_result_options(map_name, data_type)
+    entries = min(EVENT_ENTRIES, len(options))
+    rates = sample_rate_tables(count, entries, gen, **bounds)
+    # Random keys per table: argsort gives count independent permutations
+    picks = np.argsort(gen.random((count, len(options))), axis=-1)[:, :entries]
+
+    tables = []
+    for table_rates, table_picks in zip(rates.tolist(), picks.tolist()):
+        table = []
+        for entry_rates, option in zip(table_rates, table_picks):
+            entry = dict(zip(EVENT_RATES, entry_rates))
+            entry["Result"] = options[option]
+            table.append(entry)
+        tables.append(table)
+    return tables
@@ -0,0 +1,105 @@
+import json
+import os
+
+from workspace_journal import write_workspace_json
+from workspace_overlay import resolve_read_path
+from workspace_store import load_json_document
+
+result_options = {
+    "LuckyMass": [
+        "7Coin",
+        "10Coin",
+        "12Coin",
+        "15Coin",
+        "20Coin",
+        "10CoinTakeMass",
+        "DoubleDice",
+        "WarpBox",
+        "JustDice",
+        "NormalDokan",
+        "ItemBag",
+        "WanwanWhistle",
+        "Kinoko",
+        "ManyKinoko",
+        "SlowKinoko",
+        "ChangeBox",
+        "TripleDice",
+    ],
+    "UnluckyMass": [
+        "Rob3Coin",
+        "Rob5Coin",
+        "Rob7Coin",
+        "Give3Coin",
+        "Give5Coin",
+        "Give7Coin",
+        "GetStone",
+        "GiveItem",
+    ],
+    "KoopaMass": [
+        "Rob10Coin",
+        "Rob15Coin",
+        "Rob20Coin",
+        "Rob30Coin",
+        "RobHalfCoin",
+        "Rob10CoinAll",
+        "Revolution",
+        "Shuffle",
+        "Rob1Star",
+        "Get100Star",
+        "Get1000Coin",
+    ],
+}
+
+
+
+def event_result_options(map_name, data_type):
+    options = result_options.get(data_type, [])[:]
+    if data_type == "LuckyMass":
+        if map_name == "Map02" or map_name == "Map06":
+            options.append("Key")
+        if map_name == "Map03":
+            options.append("Roulette")
+    return options
+
+
+def process_event_data(event_data):
+    results = []
+    for entry in event_data:
+        if all(key in entry for key in ["Rate0", "Rate1", "Rate2", "Rate3", "Result"]):
+            results.append(dict(entry))
+        else:
+            continue
+    return results
+
+
+def load_event_mapdata(base_path, map_name, data_type):
+    event_data = {}
+    raw_event_data = []
+    if data_type == "KoopaMass" and map_name != "Map06":
+        map_name = "Map00"
+    file_name = os.path.join(
+        "bd~bd00.nx", "bd", "bd00", "data", f"bd00_{data_type}_{map_name}.json"
+    )
+    file_path = resolve_read_path(base_path, file_name)
+
+    try:
+        raw_event_data = load_json_document(file_path).get(map_name, [])
+    except FileNotFoundError:
+        print(f"File not found: {file_name}")
+    except json.JSONDecodeError:
+        print(f"Error occurred while reading file: {file_name}")
+
+    event_data = process_event_data(raw_event_data)
+    return event_data
+
+
+def save_event_mapdata(
+    base_path, event_data, map_name, data_type, write_json=write_workspace_json
+):
+    if data_type == "KoopaMass" and map_name != "Map06":
+        map_name = "Map00"
+    file_name = os.path.join(
+        "bd~bd00.nx", "bd", "bd00", "data", f"bd00_{data_type}_{map_name}.json"
+    )
+    file_data = {map_name: event_data}
+    write_json(base_path, file_name, file_data, indent=4)
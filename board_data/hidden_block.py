@@ -0,0 +1,79 @@
+import json
+import os
+
+from workspace_journal import write_workspace_json
+from workspace_overlay import resolve_read_path
+from workspace_store import load_json_document
+
+
+LOTS = [
+    {"data": -1, "name": "\u20071 Star"},
+    {"data": 5, "name": "\u20075 Coins"},
+    {"data": 6, "name": "\u20076 Coins"},
+    {"data": 7, "name": "\u20077 Coins"},
+    {"data": 8, "name": "\u20078 Coins"},
+    {"data": 9, "name": "\u20079 Coins"},
+    {"data": 10, "name": "10 Coins"},
+    {"data": 12, "name": "12 Coins"},
+    {"data": 13, "name": "13 Coins"},
+    {"data": 15, "name": "15 Coins"},
+    {"data": 20, "name": "20 Coins"},
+    {"data": 30, "name": "30 Coins"},
+]
+
+
+def get_lot_name_by_data(data):
+    for lot in LOTS:
+        if lot["data"] == data:
+            return lot["name"]
+    return f"Unknown ({data})"
+
+
+def get_lot_data_by_name(name):
+    for lot in LOTS:
+        if lot["name"] == name:
+            return lot["data"]
+    return None
+
+
+def process_hiddenblock_data(hiddenblock_data):
+    results = []
+    for entry in hiddenblock_data:
+        if all(key in entry for key in ["Result", "No", "Rate"]):
+            results.append(dict(entry))
+        else:
+            continue
+    return results
+
+
+def load_hiddenblock_mapdata(base_path, map_name):
+    hiddenblock_data = []
+    file_name = os.path.join(
+        "bd~bd00.nx", "bd", "bd00", "data", "bd00_HiddenBlock.json"
+    )
+    file_path = resolve_read_path(base_path, file_name)
+
+    try:
+        hiddenblock_data = load_json_document(file_path).get("HiddenBlock", [])
+    except FileNotFoundError:
+        print(f"File not found: {file_name}")
+    except json.JSONDecodeError:
+        print(f"Error occurred while reading file: {file_name}")
+
+    hiddenblock_data = process_hiddenblock_data(hiddenblock_data)
+    return hiddenblock_data
+
+
+def save_hiddenblock_mapdata(
+    base_path, hiddenblock_data, map_name, write_json=write_workspace_json
+):
+    file_name = os.path.join(
+        "bd~bd00.nx", "bd", "bd00", "data", "bd00_HiddenBlock.json"
+    )
+    try:
+        file_data = {"HiddenBlock": hiddenblock_data}
+        write_json(base_path, file_name, file_data, indent=4)
+    except FileNotFoundError:
+        print(f"File not found: {file_name}")
+    except json.JSONDecodeError:
+        print(f"Error occurred while writing to file: {file_name}")
@@ -0,0 +1,46 @@
+import json
+import os
+
+from workspace_journal import write_workspace_json
+from workspace_overlay import resolve_read_path
+from workspace_store import load_json_document
+
+
+def process_itembag_data(item_data, data_key):
+    results = []
+    for entry in item_data:
+        if all(key in entry for key in ["Item", "Phase", "Unique"]):
+            results.append(dict(entry))
+        else:
+            continue
+    return results
+
+
+def load_itembag_mapdata(base_path, map_name):
+    item_bag_data = {}
+    item_bag_raw_data = []
+    file_name = os.path.join(
+        "bd~bd00.nx", "bd", "bd00", "data", f"bd00_ItemBag_{map_name}.json"
+    )
+    file_path = resolve_read_path(base_path, file_name)
+    try:
+        item_bag_raw_data = load_json_document(file_path).get(map_name)
+    except FileNotFoundError:
+        print(f"File not found : {file_name}")
+    except json.JSONDecodeError:
+        print(f"Error occurred while reading file : {file_name}")
+
+    item_bag_data[map_name] = process_itembag_data(item_bag_raw_data, "ItemBag")
+    return item_bag_data
+
+
+def save_itembag_mapdata(
+    base_path, item_bag_data, map_name, write_json=write_workspace_json
+):
+    file_name = os.path.join(
+        "bd~bd00.nx", "bd", "bd00", "data", f"bd00_ItemBag_{map_name}.json"
+    )
+    file_data = {}
+    file_data[f"{map_name}"] = []
+    file_data[f"{map_name}"] = item_bag_data
+    write_json(base_path, file_name, file_data, indent=4)
@@ -0,0 +1,20 @@
+from board_data.events import load_event_mapdata
+from board_data.hidden_block import load_hiddenblock_mapdata
+from board_data.item_bag import load_itembag_mapdata
+from board_data.item_mass import load_itemmass_mapdata
+from board_data.item_shop import load_itemshop_mapdata
+from board_data.map_layout import load_map_layout_mapdata
+
+
+def load_map_data(workspace_path, map_name):
+    """Every editor input of one map, read without touching any widget"""
+    return {
+        "ItemShop": load_itemshop_mapdata(workspace_path, map_name),
+        "ItemBag": load_itembag_mapdata(workspace_path, map_name),
+        "ItemMass": load_itemmass_mapdata(workspace_path, map_name),
+        "LuckyMass": load_event_mapdata(workspace_path, map_name, "LuckyMass"),
+        "UnluckyMass": load_event_mapdata(workspace_path, map_name, "UnluckyMass"),
+        "KoopaMass": load_event_mapdata(workspace_path, map_name, "KoopaMass"),
+        "HiddenBlock": load_hiddenblock_mapdata(workspace_path, map_name),
+        "MapLayout": load_map_layout_mapdata(workspace_path, map_name),
+    }
@@ -0,0 +1,72 @@
+import copy
+import os
+
+from workspace_journal import write_workspace_json
+from workspace_overlay import resolve_read_path
+from workspace_store import load_json_document
+
+mass_attr_list = [
+    "Item",
+    "Chance",
+    "Plus",
+    "Minus",
+    "Lucky",
+    "Unlucky",
+    "VS",
+    "Koopa",
+    # "Happening","SpotItemShopNokonoko", "SpotItemShopKameck", "SpotBranch", "SpotEvent", "SpotBranchKey", "SpotTeresa"
+]
+
+
+
+def get_file_name(file_type, map_name):
+    map_index = int(map_name.replace("Map", ""))
+    return os.path.join(
+        f"bd~bd{map_index:02d}.nx",
+        "bd",
+        f"bd{map_index:02d}",
+        "data",
+        f"bd{map_index:02d}_{file_type}.json",
+    )
+
+
+def get_file_path(file_type, workspace_path, map_name):
+    return resolve_read_path(workspace_path, get_file_name(file_type, map_name))
+
+
+def load_map_layout_mapdata(workspace_path, map_name):
+    file_path_nodes = get_file_path("MapNode", workspace_path, map_name)
+    file_path_path = get_file_path("MapPath", workspace_path, map_name)
+
+    try:
+        data_nodes = load_json_document(file_path_nodes)
+        data_path = load_json_document(file_path_path)
+
+        # Nodes are edited in place: copy them out of the shared store
+        map_layout_data = {
+            "MapNode": copy.deepcopy(data_nodes["MapNode"]),
+            "MapPath": copy.deepcopy(data_path["MapPath"]),
+        }
+        return map_layout_data
+    except FileNotFoundError as e:
+        print(f"Error occurred while reading file : {e}")
+    return {"MapNode": [], "MapPath": []}
+
+
+def save_map_layout_mapdata(
+    workspace_path, map_name, map_layout_data, write_json=write_workspace_json
+):
+    data_nodes = {"MapNode": map_layout_data["MapNode"]}
+    data_path = {"MapPath": map_layout_data["MapPath"]}
+
+    try:
+        write_json(
+            workspace_path, get_file_name("MapNode", map_name), data_nodes,
+            ensure_ascii=False, indent=4,
+        )
+        write_json(
+            workspace_path, get_file_name("MapPath", map_name), data_path,
+            ensure_ascii=False, indent=4,
+        )
+    except OSError as e:
+        print(f"Error occurred while writing file : {e}")
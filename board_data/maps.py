@@ -0,0 +1,101 @@
+import os
+
+from workspace_overlay import resolve_read_path
+from workspace_store import load_json_document
+
+MAP_NAMES = [f"Map{i:02d}" for i in range(1, 8)]
+
+general_items = [
+    "Stone",
+    "ItemBag",
+    "Kinoko",
+    "ManyKinoko",
+    "SlowKinoko",
+    "ManySlowKinoko",
+    "SuperSlowKinoko",
+    "JustDice",
+    "DoubleDice",
+    "TripleDice",
+    "GoldDoubleDice",
+    "GoldTripleDice",
+    "NormalPipe",
+    "GoldPipe",
+    "WarpBox",
+    "ShoppingPipe",
+    "ChangeBox",
+    "SuperChangeBox",
+    "KoopaPhone",
+    "ShoppingPhone",
+    "StealBox",
+    "DuelGrove",
+    "SuperDuelGrove",
+    "10CoinTakeMass",
+    "HalfCoinTakeMass",
+    "StarTakeMass",
+    "TereBell",
+    "WanwanWhistle",
+    "HiddenBlockCard",
+]
+
+map_items = {
+    "Map01": {"name": "Goomba Lagoon", "items": ["Shell"]},
+    "Map02": {"name": "Western Land", "items": ["Key"]},
+    "Map03": {"name": "Mario's Rainbow Castle", "items": ["Roulette"]},
+    "Map04": {"name": "Roll 'em Raceway", "items": ["MachDice"]},
+    "Map05": {
+        "name": "Rainbow Galleria",
+        "items": ["PriceHikeSticker"],
+    },
+    "Map06": {
+        "name": "King Bowser's Keep",
+        "items": [
+            "ConveyorSwitch",
+            "Key",
+        ],
+    },
+    "Map07": {
+        "name": "Mega Wiggler's Tree Party",
+        "items": ["AlarmClock"],
+    },
+}
+
+
+def workspace_data_errors(workspace_path):
+    """Messages for every board data file of the workspace that cannot be read.
+
+    Files are parsed through the shared store, so the editors reuse them.
+    """
+    files = [
+        os.path.join("bd~bd00.nx", "bd", "bd00", "data", "bd00_HiddenBlock.json"),
+        os.path.join("bd~bd00.nx", "bd", "bd00", "data", "bd00_PlayerMove.json"),
+    ]
+    for i in range(1, 8):
+        files += [
+            os.path.join(
+                "bd~bd00.nx",
+                "bd",
+                "bd00",
+                "data",
+                f"bd00_{data_type}_Map{str(i).zfill(2)}.json",
+            )
+            for data_type in ["ItemBag", "ItemMass", "ItemShop", "LuckyMass", "UnluckyMass"]
+        ]
+        files += [
+            os.path.join(
+                f"bd~bd{str(i).zfill(2)}.nx",
+                "bd",
+                f"bd{str(i).zfill(2)}",
+                "data",
+                f"bd{str(i).zfill(2)}_{data_type}.json",
+            )
+            for data_type in ["MapNode", "MapPath"]
+        ]
+
+    errors = []
+    for file in files:
+        file_path = resolve_read_path(workspace_path, file)
+        try:
+            load_json_document(file_path)
+        except Exception as error:
+            errors.append(f"Cannot Read File {file_path}:\n {error}\n")
+    return errors
@@ -0,0 +1,32 @@
+import copy
+import os
+
+from workspace_journal import write_workspace_json
+from workspace_overlay import resolve_read_path
+from workspace_store import load_json_document
+
+PLAYER_MOVE_FILE = os.path.join("bd~bd00.nx", "bd", "bd00", "data", "bd00_PlayerMove.json")
+
+
+def load_player_move_mapdata(base_path):
+    file_path = resolve_read_path(base_path, PLAYER_MOVE_FILE)
+    try:
+        # set_player_move_speeds edits in place: copy out of the shared store
+        return copy.deepcopy(load_json_document(file_path))
+    except Exception as error:
+        print(f"Cannot Read File {file_path}:\n {error}\n")
+    return {}
+
+
+def set_player_move_speeds(player_move_parameters_data, max_speed, circuit_speed, mach_speed):
+    for player_move in player_move_parameters_data["PlayerMove"]:
+        player_move["MaxSpeed"] = int(max_speed)
+        player_move["CircuitSpeed"] = int(circuit_speed)
+        player_move["MachSpeed"] = int(mach_speed)
+    return player_move_parameters_data
+
+
+def save_player_move_mapdata(
+    base_path, player_move_parameters_data, write_json=write_workspace_json
+):
+    write_json(base_path, PLAYER_MOVE_FILE, player_move_parameters_data, indent=4)
@@ -0,0 +1,143 @@
+import random
+
+import numpy as np
+
+from board_data.event_rates import sample_event_tables
+from board_data.events import save_event_mapdata
+from board_data.hidden_block import LOTS, save_hiddenblock_mapdata
+from board_data.item_bag import save_itembag_mapdata
+from board_data.item_mass import save_itemmass_mapdata
+from board_data.item_shop import save_itemshop_mapdata
+from board_data.map_layout import (
+    load_map_layout_mapdata,
+    mass_attr_list,
+    save_map_layout_mapdata,
+)
+from board_data.maps import MAP_NAMES, general_items, map_items
+from workspace_journal import JournalBatch
+
+# Randomization rules of the editor, on plain data (no widgets). Every
+# function draws from rng, so a random.Random(seed) makes a run reproducible.
+
+ITEM_MASS_LOTS = [0, 1, 2, 3, 5, 7, 8]
+HIDDEN_BLOCK_LOTS = 6
+EVENT_TYPES = ["LuckyMass", "UnluckyMass", "KoopaMass"]
+
+
+def randomize_itemshop_phase(map_name, phase_name, rng=random):
+    item_pack = ["Empty"] + map_items[map_name]["items"] + general_items
+    if phase_name == "P2":
+        item_pack.remove("ItemBag")
+    prices = [1, 5, 10, 15] if phase_name == "P2" else [1, 5, 10, 15, 20, 25, 30, 50]
+    slots = {}
+    for slot_num in range(1, 7):
+        slots[f"slot{slot_num}"] = {
+            "item": rng.choice(item_pack),
+            "count": rng.choice([1, 2]),
+            "price": rng.choice(prices),
+        }
+    return slots
+
+
+def randomize_itemshop_data(map_name, rng=random):
+    return {
+        shop_name: {
+            phase_name: randomize_itemshop_phase(map_name, phase_name, rng)
+            for phase_name in ["P0", "P1", "P2"]
+        }
+        for shop_name in ["KoopaShop", "KamekShop"]
+    }
+
+
+def randomize_itembag_data(map_name, rng=random, add_probability=0.5, unique_probability=0.2):
+    combined_items = map_items[map_name]["items"] + general_items
+    items = []
+    for phase in range(2):
+        random_items = rng.sample(combined_items, 2)
+        items.append({"Item": random_items[0], "Phase": phase, "Unique": 1})
+        items.append({"Item": random_items[1], "Phase": phase, "Unique": 0})
+        for item in combined_items:
+            if item not in random_items and rng.random() < add_probability:
+                unique = rng.random() < unique_probability
+                items.append({"Item": item, "Phase": phase, "Unique": int(unique)})
+    return items
+
+
+def randomize_itemmass_data(map_name, rng=random, probability=0.2):
+    combined_items = map_items[map_name]["items"] + general_items
+    items = []
+    for lot_no in ITEM_MASS_LOTS:
+        for item in combined_items:
+            if rng.random() < probability:
+                items.append({"Item": item, "No": lot_no})
+    return items
+
+
+def randomize_event_data(map_name, data_type, rng=random):
+    """One valid event table (every rate column non-zero), see event_rates"""
+    gen = np.random.default_rng(rng.getrandbits(64))
+    return sample_event_tables(map_name, data_type, 1, gen)[0]
+
+
+def randomize_hiddenblock_data(rng=random):
+    hidden_block_data = []
+    for lot_no in range(HIDDEN_BLOCK_LOTS):
+        for lot in LOTS:
+            hidden_block_data.append(
+                {"No": lot_no, "Result": lot["data"], "Rate": rng.randint(0, 255)}
+            )
+    return hidden_block_data
+
+
+def randomize_map_layout_data(map_name, map_layout_data, rng=random):
+    map_index = int(map_name.replace("Map", ""))
+    for node in map_layout_data["MapNode"]:
+        if map_index != 7 or node["NodeNo"] not in range(59, 67):
+            if node["MassAttr"] in mass_attr_list and node["NpcNodeNo0"] == -1:
+                node["MassAttr"] = rng.choice(mass_attr_list)
+    return map_layout_data
+
+
+def randomize_workspace(workspace_path, map_names=None, seed=None):
+    """Randomize and save the board data of map_names (all maps by default).
+
+    The same seed and map_names always produce the same files. Files shared
+    by several maps (KoopaMass of Map00, HiddenBlock) are randomized once.
+    """
+    rng = random.Random(seed)
+    map_names = map_names or MAP_NAMES
+    shared_done = set()
+    with JournalBatch(workspace_path) as batch:
+        write_json = batch.write_json
+        for map_name in map_names:
+            save_itemshop_mapdata(
+                workspace_path, map_name, randomize_itemshop_data(map_name, rng), write_json
+            )
+            save_itembag_mapdata(
+                workspace_path, randomize_itembag_data(map_name, rng), map_name, write_json
+            )
+            save_itemmass_mapdata(
+                workspace_path, randomize_itemmass_data(map_name, rng), map_name, write_json
+            )
+
+            for data_type in EVENT_TYPES:
+                if data_type == "KoopaMass" and map_name != "Map06":
+                    if "KoopaMass" in shared_done:
+                        continue
+                    shared_done.add("KoopaMass")
+                event_data = randomize_event_data(map_name, data_type, rng)
+                save_event_mapdata(workspace_path, event_data, map_name, data_type, write_json)
+
+            if "HiddenBlock" not in shared_done:
+                shared_done.add("HiddenBlock")
+                save_hiddenblock_mapdata(
+                    workspace_path, randomize_hiddenblock_data(rng), map_name, write_json
+                )
+
+            map_layout_data = load_map_layout_mapdata(workspace_path, map_name)
+            save_map_layout_mapdata(
+                workspace_path,
+                map_name,
+                randomize_map_layout_data(map_name, map_layout_data, rng),
+                write_json,
+            )
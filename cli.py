@@ -0,0 +1,249 @@
+"""Headless SMPJ Map Editor: extract, validate, randomize and export without Tk.
+
+    python cli.py [--json FILE|-] extract [--editor-only]
+    python cli.py validate [--workspace NAME] [--repair]
+    python cli.py randomize NAME [--seed N] [--maps Map01 Map02 ...]
+    python cli.py export NAME [--zip] [--no-folders]
+    python cli.py batch PREFIX --count N [--seed N] [--export] [--workers N]
+
+--json writes {"command", "exit_code", "timings": {stage: seconds}, ...} so
+bulk builds can be scripted and timed.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from app_config import (
+    BASE_PATH,
+    CORE_DIR,
+    EXPECTED_CORE_CHECKSUMS,
+    EXPECTED_CORE_MERKLE_ROOTS,
+    EXPORT_LAYOUT_FOLDERS,
+    EXPORT_ZIP_BUNDLE,
+    OUTPUT_DIR,
+    REQUIRED_BEA_FILES,
+    WORKSPACE_DIR,
+)
+from core_integrity import core_checksum, repair_core_json
+
+
+class Timings:
+    def __init__(self):
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = round(time.perf_counter() - start, 6)
+
+
+def _verify_core(timings, report, repair=True):
+    """repair=False leaves CORE untouched and only counts the files to repair"""
+    with timings.stage("repair_core_json"):
+        repaired, normalized = repair_core_json(CORE_DIR, dry_run=not repair)
+    if not repair and (repaired or normalized):
+        print(
+            f"[WARN] {repaired} broken and {normalized} non-canonical .json files in CORE "
+            "(run validate --repair to fix them)"
+        )
+    with timings.stage("core_checksum"):
+        checksum = core_checksum(CORE_DIR, known_roots=EXPECTED_CORE_MERKLE_ROOTS)
+    report["core"] = {
+        "repaired": repaired,
+        "normalized": normalized,
+        "written": repair,
+        "checksum": checksum,
+        "version": EXPECTED_CORE_CHECKSUMS.get(checksum),
+    }
+    if checksum not in EXPECTED_CORE_CHECKSUMS:
+        print(f"[ERR] CORE checksum {checksum} does not match a supported game version")
+        return False
+    return True
+
+
+def _workspace_path(name):
+    return os.path.join(WORKSPACE_DIR, name)
+
+
+# ----------------------------------------------------------------------
+# Commands
+# ----------------------------------------------------------------------
+
+def cmd_extract(args, timings, report):
+    from bea_archive_manager import EDITOR_DATA_PATTERNS, bea_archives_extractor
+
+    for bea_folder in REQUIRED_BEA_FILES:
+        os.makedirs(os.path.join(CORE_DIR, bea_folder), exist_ok=True)
+    patterns = EDITOR_DATA_PATTERNS if args.editor_only else None
+    with timings.stage("extract"):
+        code = bea_archives_extractor(
+            BASE_PATH, REQUIRED_BEA_FILES, patterns=patterns, workers=args.workers
+        )
+    report["extractor_code"] = code
+    if code != 0:
+        print(f"[ERR] BEA extraction failed (code {code})")
+        return 1
+    if args.editor_only:
+        # A partial CORE never matches the expected checksums: only repair it
+        with timings.stage("repair_core_json"):
+            repaired, normalized = repair_core_json(CORE_DIR)
+        report["core"] = {"repaired": repaired, "normalized": normalized, "partial": True}
+        print("[INFO] Board data only: CORE checksum not verified (the GUI needs a full extract)")
+        return 0
+    return 0 if _verify_core(timings, report) else 1
+
+
+def cmd_validate(args, timings, report):
+    from board_data.maps import workspace_data_errors
+
+    ok = _verify_core(timings, report, repair=args.repair)
+    if args.workspace:
+        with timings.stage("workspace_data"):
+            errors = workspace_data_errors(_workspace_path(args.workspace))
+        report["workspace_errors"] = errors
+        for error in errors:
+            print(f"[ERR] {error}")
+        ok = ok and not errors
+    return 0 if ok else 1
+
+
+def cmd_randomize(args, timings, report):
+    from board_data.randomize import randomize_workspace
+    from workspace_overlay import create_overlay_workspace
+
+    workspace_path = _workspace_path(args.workspace)
+    if not os.path.exists(workspace_path):
+        create_overlay_workspace(CORE_DIR, workspace_path)
+        print(f"[INFO] Workspace created: {workspace_path}")
+    with timings.stage("randomize"):
+        randomize_workspace(workspace_path, args.maps, args.seed)
+    report["seed"] = args.seed
+    return 0
+
+
+def cmd_export(args, timings, report):
+    from export_packaging import export_workspace
+
+    workspace_path = _workspace_path(args.workspace)
+    if not os.path.isdir(workspace_path):
+        print(f"[ERR] Workspace not found: {workspace_path}")
+        return 1
+    with timings.stage("export"):
+        code = export_workspace(
+            workspace_path,
+            CORE_DIR,
+            BASE_PATH,
+            OUTPUT_DIR,
+            layout_folders=args.folders,
+            zip_bundle=args.zip,
+        )
+    report["repacker_code"] = code
+    if code != 0:
+        print(f"[ERR] BEA repack failed (code {code})")
+        return 1
+    return 0
+
+
+def cmd_batch(args, timings, report):
+    from variant_batch import generate_variants
+
+    with timings.stage("batch"):
+        results = generate_variants(
+            args.prefix,
+            args.count,
+            args.seed,
+            CORE_DIR,
+            WORKSPACE_DIR,
+            map_names=args.maps,
+            export=args.export,
+            base_path=BASE_PATH,
+            output_dir=OUTPUT_DIR,
+            layout_folders=args.folders,
+            zip_bundle=args.zip,
+            workers=args.workers,
+            overwrite=args.overwrite,
+        )
+    report["variants"] = results
+    return 0 if all(result["exit_code"] == 0 for result in results) else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="SMPJ Map Editor (headless)")
+    parser.add_argument(
+        "--json", metavar="FILE", help="write a machine-readable report ('-' for stdout)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    extract = commands.add_parser("extract", help="extract ROMFS archives into CORE")
+    extract.add_argument("--workers", type=int, default=None)
+    extract.add_argument(
+        "--editor-only",
+        action="store_true",
+        help="only the board data files the editor reads (enough for randomize/export/batch)",
+    )
+    extract.set_defaults(func=cmd_extract)
+
+    validate = commands.add_parser("validate", help="verify CORE (and a workspace)")
+    validate.add_argument("--workspace", metavar="NAME")
+    validate.add_argument(
+        "--repair", action="store_true", help="rewrite broken or non-canonical CORE .json files"
+    )
+    validate.set_defaults(func=cmd_validate)
+
+    randomize = commands.add_parser("randomize", help="randomize a workspace's board data")
+    randomize.add_argument("workspace", metavar="NAME")
+    randomize.add_argument("--maps", nargs="+", metavar="MapXX")
+    randomize.add_argument("--seed", type=int, default=None)
+    randomize.set_defaults(func=cmd_randomize)
+
+    export = commands.add_parser("export", help="repack a workspace into mod layouts")
+    export.add_argument("workspace", metavar="NAME")
+    export.add_argument("--zip", action="store_true", default=EXPORT_ZIP_BUNDLE)
+    export.add_argument(
+        "--no-folders", dest="folders", action="store_false", default=EXPORT_LAYOUT_FOLDERS
+    )
+    export.set_defaults(func=cmd_export)
+
+    batch = commands.add_parser("batch", help="generate seeded randomized variants")
+    batch.add_argument("prefix", metavar="PREFIX")
+    batch.add_argument("--count", type=int, required=True)
+    batch.add_argument("--seed", type=int, default=0, help="seed of variant 0 (variant i: seed + i)")
+    batch.add_argument("--maps", nargs="+", metavar="MapXX")
+    batch.add_argument("--export", action="store_true", help="also export every variant")
+    batch.add_argument("--zip", action="store_true", default=EXPORT_ZIP_BUNDLE)
+    batch.add_argument(
+        "--no-folders", dest="folders", action="store_false", default=EXPORT_LAYOUT_FOLDERS
+    )
+    batch.add_argument("--workers", type=int, default=None)
+    batch.add_argument("--overwrite", action="store_true", help="replace existing variant workspaces")
+    batch.set_defaults(func=cmd_batch)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    timings = Timings()
+    report = {"command": args.command}
+    with timings.stage("total"):
+        exit_code = args.func(args, timings, report)
+    report["exit_code"] = exit_code
+    report["timings"] = timings.stages
+
+    if args.json == "-":
+        print(json.dumps(report))
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+    return exit_code
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
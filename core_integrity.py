@@ -0,0 +1,267 @@
+import codecs
+import hashlib
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from json_codec import dumps_bytes, loads
+
+MANIFEST_VERSION = 2
+
+
+def core_manifest_path(core_dir):
+    """The manifest lives next to CORE (never inside, it would change the checksum)"""
+    return os.path.normpath(core_dir) + ".manifest.json"
+
+
+def iter_core_files(directory):
+    """Files of directory in checksum order: sorted os.walk, then sorted names"""
+    for root, _, files in sorted(os.walk(directory)):
+        for file in sorted(files):
+            yield os.path.join(root, file)
+
+
+def _rel_key(directory, file_path):
+    return os.path.relpath(file_path, directory).replace(os.sep, "/")
+
+
+# Hashing threads (hashlib releases the GIL on large buffers)
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+_READ_SIZE = 4 * 1024 * 1024
+
+
+def _hash_file(file_path):
+    """sha256 hex of one file, read in large blocks"""
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_READ_SIZE):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _read_file(file_path, hash_content):
+    """(content, sha256 hex or None) of one file"""
+    with open(file_path, "rb") as f:
+        data = f.read()
+    return data, hashlib.sha256(data).hexdigest() if hash_content else None
+
+
+def _ordered_map(func, args_list, workers=None):
+    """Yield func(*args) for every args tuple, in input order, computed concurrently.
+
+    At most a few calls per worker are in flight, which bounds memory when
+    the results hold file contents.
+    """
+    workers = workers or HASH_WORKERS
+    if workers <= 1 or len(args_list) <= 1:
+        for args in args_list:
+            yield func(*args)
+        return
+
+    window = workers * 4
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for args in args_list:
+            pending.append(pool.submit(func, *args))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def hash_files(file_paths, workers=None):
+    """Yield (path, sha256 hex) in input order, hashing concurrently"""
+    file_paths = list(file_paths)
+    yield from zip(file_paths, _ordered_map(_hash_file, [(path,) for path in file_paths], workers))
+
+
+def calculate_checksum_for_directory(directory, files=None, workers=None):
+    """Combined SHA-256 of every file's bytes, in checksum order, in one read.
+
+    Worker threads read the files ahead (and hash those whose record in
+    files has no sha256 yet) while their bytes are streamed in order into
+    the combined hash.
+    """
+    combined = hashlib.sha256()
+    records = [
+        (file_path, files.get(_rel_key(directory, file_path)) if files else None)
+        for file_path in iter_core_files(directory)
+    ]
+    reads = _ordered_map(
+        _read_file,
+        [(file_path, record is not None and record["sha256"] is None) for file_path, record in records],
+        workers,
+    )
+    for (_, record), (data, digest) in zip(records, reads):
+        combined.update(data)
+        if digest is not None:
+            record["sha256"] = digest
+    return combined.hexdigest()
+
+
+def merkle_root(files):
+    """Merkle root over per-file records, in sorted relative-path order.
+
+    Leaves are sha256(path NUL size NUL file sha256); each level hashes
+    adjacent pairs and an odd last node is promoted unchanged. Paths use '/'
+    so the root is identical across runs and platforms.
+    """
+    level = [
+        hashlib.sha256(f"{rel}\0{files[rel]['size']}\0{files[rel]['sha256']}".encode("utf-8")).digest()
+        for rel in sorted(files)
+    ]
+    if not level:
+        return hashlib.sha256(b"").hexdigest()
+    while len(level) > 1:
+        paired = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
+
+def load_manifest(manifest_path):
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def save_manifest(manifest_path, manifest):
+    tmp_path = manifest_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp_path, manifest_path)
+    except OSError as error:
+        print(f"Cannot write CORE manifest {manifest_path}:\n {error}\n")
+
+
+def _stat_records(directory, manifest):
+    """Per-file records in checksum order, and the paths of files whose size or
+    mtime changed (their records have sha256 None)"""
+    known = manifest.get("files", {})
+    files = {}
+    stale = []
+    for file_path in iter_core_files(directory):
+        rel = _rel_key(directory, file_path)
+        stat = os.stat(file_path)
+        record = known.get(rel)
+        if (
+            record is None
+            or record["size"] != stat.st_size
+            or record["mtime_ns"] != stat.st_mtime_ns
+        ):
+            record = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": None}
+            stale.append(file_path)
+        files[rel] = record
+    return files, stale
+
+
+# Merkle roots remembered per manifest ({root: combined checksum})
+MAX_KNOWN_ROOTS = 16
+
+
+def core_checksum(directory, manifest_path=None, workers=None, known_roots=None):
+    """Combined CORE checksum (same value as calculate_checksum_for_directory).
+
+    Per-file records (size, mtime, SHA-256) are reduced to a Merkle root that
+    identifies the content. When some root is already mapped to its checksum,
+    by known_roots ({root: checksum}, e.g. EXPECTED_CORE_MERKLE_ROOTS) or by an
+    earlier run recorded in the manifest, only changed files are re-hashed
+    (concurrently) and a known root answers without reading the rest. Otherwise
+    one concurrent read computes both the missing file hashes and the checksum.
+    """
+    manifest_path = manifest_path or core_manifest_path(directory)
+    manifest = load_manifest(manifest_path)
+    files, stale = _stat_records(directory, manifest)
+
+    roots = dict(manifest.get("known_roots", {}))
+    if manifest.get("checksum") and manifest.get("merkle_root"):
+        roots.setdefault(manifest["merkle_root"], manifest["checksum"])
+    roots.update(known_roots or {})
+    checksum = None
+    if roots:
+        for file_path, digest in hash_files(stale, workers):
+            files[_rel_key(directory, file_path)]["sha256"] = digest
+        checksum = roots.get(merkle_root(files))
+    if checksum is None:
+        checksum = calculate_checksum_for_directory(directory, files, workers)
+    root = merkle_root(files)
+    if root not in roots:
+        print(f"[INFO] CORE Merkle root {root} (checksum {checksum})")
+
+    learned = {
+        known_root: value
+        for known_root, value in manifest.get("known_roots", {}).items()
+        if known_root != root
+    }
+    learned[root] = checksum
+    save_manifest(
+        manifest_path,
+        {
+            "version": MANIFEST_VERSION,
+            "checksum": checksum,
+            "merkle_root": root,
+            "known_roots": dict(list(learned.items())[-MAX_KNOWN_ROOTS:]),
+            "files": files,
+        },
+    )
+    return checksum
+
+
+def _canonical_json_bytes(data):
+    """Bytes written by json.dump(indent=4) to a "w", utf-8-sig text file"""
+    return dumps_bytes(data, indent=4, ensure_ascii=False)
+
+
+def repair_core_json(directory, dry_run=False):
+    """Repair and normalize the .json files of directory, writing only when needed.
+
+    Files that parse strictly and are already in canonical form (BOM, indent=4)
+    are left untouched. Valid but differently formatted files are rewritten
+    canonically; only files that fail to parse go through the regex repair.
+    Returns (repaired, normalized) counts; with dry_run nothing is written and
+    the counts are the files that would be. Raises ValueError if a file still
+    cannot be parsed after repair.
+    """
+    repaired = 0
+    normalized = 0
+    for root, _, files in os.walk(directory):
+        for file in files:
+            if not file.endswith(".json"):
+                continue
+            file_path = os.path.join(root, file)
+            with open(file_path, "rb") as json_file:
+                raw = json_file.read()
+            content = raw.decode("utf-8-sig")
+
+            try:
+                json_data = loads(raw)
+                if raw.startswith(codecs.BOM_UTF8) and raw == _canonical_json_bytes(json_data):
+                    continue
+                normalized += 1
+            except json.JSONDecodeError:
+                content_fixed = re.sub(r",\s*(\]|\})", r"\1", content)
+                content_fixed = re.sub(r"(?<=\})(?=\s*,)", r"", content_fixed)
+                content_fixed = re.sub(r"\}[^}]*$", r"}", content_fixed)
+                try:
+                    json_data = json.loads(content_fixed)
+                except json.JSONDecodeError as error:
+                    raise ValueError(
+                        f"Failed to load JSON file after correction: {file_path}\n"
+                        f"Error: {error}"
+                    )
+                repaired += 1
+
+            if dry_run:
+                continue
+            with open(file_path, "wb") as json_file:
+                json_file.write(_canonical_json_bytes(json_data))
+    return repaired, normalized
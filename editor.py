@@ -1,96 +1,35 @@
-import json
 import os
+import queue
+import random
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from editor_modules.hidden_block import (
-    HiddenBlockDataManager,
-    HiddenBlockEditor,
-    load_hiddenblock_mapdata,
-    save_hiddenblock_mapdata,
-)
-from editor_modules.item_bag import (
-    ItemBagEditor,
-    load_itembag_mapdata,
-    save_itembag_mapdata,
-)
-from editor_modules.item_mass import (
-    ItemMassEditor,
-    load_itemmass_mapdata,
-    save_itemmass_mapdata,
-)
-from editor_modules.item_shop import (
-    ItemShopEditor,
-    load_itemshop_mapdata,
-    save_itemshop_mapdata,
-)
-from editor_modules.events import (
-    EventEditor,
-    EventDataManager,
-    load_event_mapdata,
-    save_event_mapdata,
-)
-from editor_modules.map_layout import (
-    MapLayoutEditor,
-    load_map_layout_mapdata,
-    save_map_layout_mapdata,
+from board_data.events import save_event_mapdata
+from board_data.hidden_block import save_hiddenblock_mapdata
+from board_data.item_bag import save_itembag_mapdata
+from board_data.item_mass import save_itemmass_mapdata
+from board_data.item_shop import save_itemshop_mapdata
+from board_data.map_data import load_map_data
+from board_data.map_layout import save_map_layout_mapdata
+from board_data.maps import general_items, map_items, workspace_data_errors
+from board_data.player_move import (
+    load_player_move_mapdata,
+    save_player_move_mapdata,
+    set_player_move_speeds,
 )
+from editor_modules.hidden_block import HiddenBlockDataManager, HiddenBlockEditor
+from editor_modules.item_bag import ItemBagEditor
+from editor_modules.item_mass import ItemMassEditor
+from editor_modules.item_shop import ItemShopEditor
+from editor_modules.events import EventEditor, EventDataManager
+from editor_modules.map_layout import MapLayoutEditor
+from save_pipeline import SaveSnapshot
+from workspace_journal import write_workspace_json
+from workspace_overlay import resolve_read_path
 
 APP_WIDTH = 1300
 APP_HEIGHT = 1000
-
-general_items = [
-    "Stone",
-    "ItemBag",
-    "Kinoko",
-    "ManyKinoko",
-    "SlowKinoko",
-    "ManySlowKinoko",
-    "SuperSlowKinoko",
-    "JustDice",
-    "DoubleDice",
-    "TripleDice",
-    "GoldDoubleDice",
-    "GoldTripleDice",
-    "NormalPipe",
-    "GoldPipe",
-    "WarpBox",
-    "ShoppingPipe",
-    "ChangeBox",
-    "SuperChangeBox",
-    "KoopaPhone",
-    "ShoppingPhone",
-    "StealBox",
-    "DuelGrove",
-    "SuperDuelGrove",
-    "10CoinTakeMass",
-    "HalfCoinTakeMass",
-    "StarTakeMass",
-    "TereBell",
-    "WanwanWhistle",
-    "HiddenBlockCard",
-]
-
-map_items = {
-    "Map01": {"name": "Goomba Lagoon", "items": ["Shell"]},
-    "Map02": {"name": "Western Land", "items": ["Key"]},
-    "Map03": {"name": "Mario's Rainbow Castle", "items": ["Roulette"]},
-    "Map04": {"name": "Roll 'em Raceway", "items": ["MachDice"]},
-    "Map05": {
-        "name": "Rainbow Galleria",
-        "items": ["PriceHikeSticker"],
-    },
-    "Map06": {
-        "name": "King Bowser's Keep",
-        "items": [
-            "ConveyorSwitch",
-            "Key",
-        ],
-    },
-    "Map07": {
-        "name": "Mega Wiggler's Tree Party",
-        "items": ["AlarmClock"],
-    },
-}
+LOAD_POLL_MS = 50
 
 map_layout_settings = {
     "Map01": {"reverse_x": False, "reverse_y": True},
@@ -240,8 +179,12 @@ class MapTab(tk.Frame):
             map_layout_settings[map_name]["reverse_y"],
         )
 
-    def load_data(self):
-        self.item_shop_data = load_itemshop_mapdata(self.WORKSPACE_PATH, self.map_name)
+    def load_data(self, map_data=None):
+        """Fill the editors from map_data (see load_map_data), read now if omitted"""
+        if map_data is None:
+            map_data = load_map_data(self.WORKSPACE_PATH, self.map_name)
+
+        self.item_shop_data = map_data["ItemShop"]
         self.koopa_shop.load_shop_data("P0", self.item_shop_data)
         self.koopa_shop.load_shop_data("P1", self.item_shop_data)
         self.koopa_shop.load_shop_data("P2", self.item_shop_data)
@@ -249,98 +192,118 @@ class MapTab(tk.Frame):
         self.kamek_shop.load_shop_data("P1", self.item_shop_data)
         self.kamek_shop.load_shop_data("P2", self.item_shop_data)
 
-        self.item_bag_data = load_itembag_mapdata(self.WORKSPACE_PATH, self.map_name)
+        self.item_bag_data = map_data["ItemBag"]
         self.item_bag.load_items(self.item_bag_data)
 
-        self.item_mass_data = load_itemmass_mapdata(self.WORKSPACE_PATH, self.map_name)
+        self.item_mass_data = map_data["ItemMass"]
         self.item_mass.load_items(self.item_mass_data)
 
-        self.luckymass_data = load_event_mapdata(
-            self.WORKSPACE_PATH, self.map_name, "LuckyMass"
-        )
+        self.luckymass_data = map_data["LuckyMass"]
         self.lucky_events.load_event_data(self.luckymass_data)
 
-        self.unluckymass_data = load_event_mapdata(
-            self.WORKSPACE_PATH, self.map_name, "UnluckyMass"
-        )
+        self.unluckymass_data = map_data["UnluckyMass"]
         self.unlucky_events.load_event_data(self.unluckymass_data)
 
-        self.koopamass_data = load_event_mapdata(
-            self.WORKSPACE_PATH, self.map_name, "KoopaMass"
-        )
+        # Shared files (KoopaMass of Map00, HiddenBlock) may already hold edits
+        # synced from a tab built earlier: those win over the saved file
+        if "KoopaMass" in self.event_data_manager.event_data.get(self.map_name, {}):
+            self.koopamass_data = self.event_data_manager.get_event_data(
+                self.map_name, "KoopaMass"
+            )
+        else:
+            self.koopamass_data = map_data["KoopaMass"]
         self.koopa_mass_events.load_event_data(self.koopamass_data)
 
-        self.hidden_block_data = load_hiddenblock_mapdata(
-            self.WORKSPACE_PATH, self.map_name
-        )
+        if self.map_name in self.hiddenblock_data_manager.hiddenblock_data:
+            self.hidden_block_data = self.hiddenblock_data_manager.get_hiddenblock_data(
+                self.map_name
+            )
+        else:
+            self.hidden_block_data = map_data["HiddenBlock"]
         self.hidden_block.load_hiddenblock_data(self.hidden_block_data)
 
-        self.map_layout_data = load_map_layout_mapdata(
-            self.WORKSPACE_PATH, self.map_name
-        )
+        self.map_layout_data = map_data["MapLayout"]
         self.map_layout.load_data(self.map_layout_data)
 
-    def randomize_data(self):
-        self.koopa_shop.randomize_shop_data("P0")
-        self.koopa_shop.randomize_shop_data("P1")
-        self.koopa_shop.randomize_shop_data("P2")
-        self.kamek_shop.randomize_shop_data("P0")
-        self.kamek_shop.randomize_shop_data("P1")
-        self.kamek_shop.randomize_shop_data("P2")
-        self.item_bag.randomize_items()
-        self.item_mass.randomize_items()
-        self.lucky_events.randomize_event_data()
-        self.unlucky_events.randomize_event_data()
-        self.koopa_mass_events.randomize_event_data()
-        self.hidden_block.randomize_hiddenblock_data()
-        self.map_layout.randomize_data()
-
-    def save_data(self):
+    def randomize_data(self, rng=random):
+        self.koopa_shop.randomize_shop_data("P0", rng)
+        self.koopa_shop.randomize_shop_data("P1", rng)
+        self.koopa_shop.randomize_shop_data("P2", rng)
+        self.kamek_shop.randomize_shop_data("P0", rng)
+        self.kamek_shop.randomize_shop_data("P1", rng)
+        self.kamek_shop.randomize_shop_data("P2", rng)
+        self.item_bag.randomize_items(rng=rng)
+        self.item_mass.randomize_items(rng=rng)
+        self.lucky_events.randomize_event_data(rng)
+        self.unlucky_events.randomize_event_data(rng)
+        self.koopa_mass_events.randomize_event_data(rng)
+        self.hidden_block.randomize_hiddenblock_data(rng)
+        self.map_layout.randomize_data(rng)
+
+    def save_data(self, write_json=write_workspace_json):
         self.item_shop_data = self.koopa_shop.save_shop_data("P0")
         self.item_shop_data = self.koopa_shop.save_shop_data("P1")
         self.item_shop_data = self.koopa_shop.save_shop_data("P2")
         self.item_shop_data = self.kamek_shop.save_shop_data("P0")
         self.item_shop_data = self.kamek_shop.save_shop_data("P1")
         self.item_shop_data = self.kamek_shop.save_shop_data("P2")
-        save_itemshop_mapdata(self.WORKSPACE_PATH, self.map_name, self.item_shop_data)
+        save_itemshop_mapdata(
+            self.WORKSPACE_PATH, self.map_name, self.item_shop_data, write_json
+        )
 
         self.item_bag_data = self.item_bag.save_items()
-        save_itembag_mapdata(self.WORKSPACE_PATH, self.item_bag_data, self.map_name)
+        save_itembag_mapdata(
+            self.WORKSPACE_PATH, self.item_bag_data, self.map_name, write_json
+        )
 
         self.item_mass_data = self.item_mass.save_items()
-        save_itemmass_mapdata(self.WORKSPACE_PATH, self.item_mass_data, self.map_name)
+        save_itemmass_mapdata(
+            self.WORKSPACE_PATH, self.item_mass_data, self.map_name, write_json
+        )
 
         self.luckymass_data = self.event_data_manager.get_event_data(
             self.map_name, "LuckyMass"
         )
         save_event_mapdata(
-            self.WORKSPACE_PATH, self.luckymass_data, self.map_name, "LuckyMass"
+            self.WORKSPACE_PATH,
+            self.luckymass_data,
+            self.map_name,
+            "LuckyMass",
+            write_json,
         )
 
         self.unluckymass_data = self.event_data_manager.get_event_data(
             self.map_name, "UnluckyMass"
         )
         save_event_mapdata(
-            self.WORKSPACE_PATH, self.unluckymass_data, self.map_name, "UnluckyMass"
+            self.WORKSPACE_PATH,
+            self.unluckymass_data,
+            self.map_name,
+            "UnluckyMass",
+            write_json,
         )
 
         self.koopamass_data = self.event_data_manager.get_event_data(
             self.map_name, "KoopaMass"
         )
         save_event_mapdata(
-            self.WORKSPACE_PATH, self.koopamass_data, self.map_name, "KoopaMass"
+            self.WORKSPACE_PATH,
+            self.koopamass_data,
+            self.map_name,
+            "KoopaMass",
+            write_json,
         )
 
         self.hidden_block_data = self.hiddenblock_data_manager.get_hiddenblock_data(
             self.map_name
         )
         save_hiddenblock_mapdata(
-            self.WORKSPACE_PATH, self.hidden_block_data, self.map_name
+            self.WORKSPACE_PATH, self.hidden_block_data, self.map_name, write_json
         )
 
         self.map_layout_data = self.map_layout.save_data()
         save_map_layout_mapdata(
-            self.WORKSPACE_PATH, self.map_name, self.map_layout_data
+            self.WORKSPACE_PATH, self.map_name, self.map_layout_data, write_json
         )
 
 
@@ -370,26 +333,29 @@ class JamboreeMapEditor(tk.Tk):
             "TNotebook.Tab", width=APP_WIDTH // 7, padding=[5, 5], anchor="center"
         )
 
+        self.load_frame = tk.Frame(self)
+        self.load_frame.pack(side="top", fill="x", padx=10, pady=5)
+        self.load_label = tk.Label(self.load_frame, text="Loading workspace data...")
+        self.load_label.pack(anchor="center")
+        self.load_progress = ttk.Progressbar(self.load_frame, mode="determinate")
+        self.load_progress.pack(fill="x")
+
         self.notebook = ttk.Notebook(self, style="TNotebook", height=600)
         self.notebook.pack(expand=1, fill="both")
 
+        # Map tabs are built on first selection (see build_map_tab), each
+        # notebook page starts as an empty frame, disabled until the loading
+        # thread has read its data into map_data
+        self.data_loaded = False
+        self.map_data = {}
+        self.tab_frames = {}
+        self.map_tabs = {}
         for i in range(1, 8):
             map_name = f"Map0{i}"
-            tab = MapTab(
-                self.notebook,
-                map_name,
-                self.item_shop_data,
-                self.item_bag_data,
-                self.item_mass_data,
-                self.event_data_manager,
-                self.hiddenblock_data_manager,
-                self.luckymass_data,
-                self.unluckymass_data,
-                self.koopamass_data,
-                self.hiddenblock_data,
-                self.WORKSPACE_PATH,
-            )
-            self.notebook.add(tab, text=map_items[map_name]["name"])
+            tab_frame = tk.Frame(self.notebook)
+            self.notebook.add(tab_frame, text=map_items[map_name]["name"], state="disabled")
+            self.tab_frames[map_name] = tab_frame
+            self.map_tabs[map_name] = None
 
             self.item_shop_data[map_name] = {
                 "KoopaShop": {"P0": {}, "P1": {}, "P2": {}},
@@ -460,147 +426,149 @@ class JamboreeMapEditor(tk.Tk):
             width=100,
         )
         self.save_button.pack(pady=5)
+        self.save_status_label = tk.Label(self.button_frame, text="")
+        self.save_status_label.pack(pady=5)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         self.after(150, self.load_data)
 
-    def load_player_move_parameters(self):
-        file_path = os.path.join(
-            self.WORKSPACE_PATH,
-            "bd~bd00.nx",
-            "bd",
-            "bd00",
-            "data",
-            "bd00_PlayerMove.json",
-        )
+    def build_map_tab(self, map_name):
+        """Create (once) and fill the MapTab of map_name"""
+        tab = self.map_tabs[map_name]
+        if tab is None:
+            tab = MapTab(
+                self.tab_frames[map_name],
+                map_name,
+                self.item_shop_data,
+                self.item_bag_data,
+                self.item_mass_data,
+                self.event_data_manager,
+                self.hiddenblock_data_manager,
+                self.luckymass_data,
+                self.unluckymass_data,
+                self.koopamass_data,
+                self.hiddenblock_data,
+                self.WORKSPACE_PATH,
+            )
+            tab.pack(expand=1, fill="both")
+            tab.load_data(self.map_data.get(map_name))
+            self.map_tabs[map_name] = tab
+        return tab
+
+    def built_map_tabs(self):
+        return [tab for tab in self.map_tabs.values() if tab is not None]
+
+    def selected_map_name(self):
+        current = self.notebook.select()
+        for map_name, tab_frame in self.tab_frames.items():
+            if str(tab_frame) == current:
+                return map_name
+        return None
+
+    def on_tab_changed(self, event):
+        map_name = self.selected_map_name()
+        if map_name in self.map_data:
+            self.build_map_tab(map_name)
+
+    def load_player_move_parameters(self, player_move_parameters_data=None):
+        if player_move_parameters_data is None:
+            player_move_parameters_data = load_player_move_mapdata(self.WORKSPACE_PATH)
         try:
-            with open(file_path, "r", encoding="utf-8-sig") as json_file:
-                player_move_parameters_data = json.load(json_file)
-                self.standard_speed_entry.set(
-                    player_move_parameters_data["PlayerMove"][0]["MaxSpeed"]
-                )
-                self.circuit_speed_entry.set(
-                    player_move_parameters_data["PlayerMove"][0]["CircuitSpeed"]
-                )
-                self.machdice_speed_entry.set(
-                    player_move_parameters_data["PlayerMove"][0]["MachSpeed"]
-                )
+            self.standard_speed_entry.set(
+                player_move_parameters_data["PlayerMove"][0]["MaxSpeed"]
+            )
+            self.circuit_speed_entry.set(
+                player_move_parameters_data["PlayerMove"][0]["CircuitSpeed"]
+            )
+            self.machdice_speed_entry.set(
+                player_move_parameters_data["PlayerMove"][0]["MachSpeed"]
+            )
         except Exception as error:
-            print(f"Cannot Read File {file_path}:\n {error}\n")
+            print(f"Cannot Read Player Move Parameters:\n {error}\n")
         return player_move_parameters_data
     
-    def save_player_move_parameters(self):
-        file_path = os.path.join(
-            self.WORKSPACE_PATH,
-            "bd~bd00.nx",
-            "bd",
-            "bd00",
-            "data",
-            "bd00_PlayerMove.json",
-        )
+    def save_player_move_parameters(self, write_json=write_workspace_json):
+        player_move_parameters_data = load_player_move_mapdata(self.WORKSPACE_PATH)
         try:
-            player_move_parameters_data = {}
-            with open(file_path, "r", encoding="utf-8-sig") as json_file:
-                player_move_parameters_data = json.load(json_file)
-                for player_move in player_move_parameters_data["PlayerMove"]:
-                    player_move["MaxSpeed"] = int(self.standard_speed_entry.get())
-                    player_move["CircuitSpeed"] = int(self.circuit_speed_entry.get())
-                    player_move["MachSpeed"] = int(self.machdice_speed_entry.get())
-            with open(file_path, "w", encoding="utf-8-sig") as json_file:
-                json.dump(player_move_parameters_data, json_file, indent=4)
+            set_player_move_speeds(
+                player_move_parameters_data,
+                self.standard_speed_entry.get(),
+                self.circuit_speed_entry.get(),
+                self.machdice_speed_entry.get(),
+            )
+            save_player_move_mapdata(
+                self.WORKSPACE_PATH, player_move_parameters_data, write_json
+            )
         except Exception as error:
-            print(f"Cannot Read File {file_path}:\n {error}\n")
+            print(f"Cannot Save Player Move Parameters:\n {error}\n")
 
     def load_data(self):
         if not os.path.exists(
-            os.path.join(self.WORKSPACE_PATH, "bd~bd00.nx", "bd", "bd00", "data")
+            resolve_read_path(self.WORKSPACE_PATH, os.path.join("bd~bd00.nx", "bd", "bd00", "data"))
         ):
             messagebox.showerror("Error", "The workspace data cannot be read correctly")
-        else:
-            errors = []
-            for i in range(1, 8):
-                for file in [
-                    os.path.join(
-                        "bd~bd00.nx",
-                        "bd",
-                        "bd00",
-                        "data",
-                        f"bd00_ItemBag_Map{str(i).zfill(2)}.json",
-                    ),
-                    os.path.join(
-                        "bd~bd00.nx",
-                        "bd",
-                        "bd00",
-                        "data",
-                        f"bd00_ItemMass_Map{str(i).zfill(2)}.json",
-                    ),
-                    os.path.join(
-                        "bd~bd00.nx",
-                        "bd",
-                        "bd00",
-                        "data",
-                        f"bd00_ItemShop_Map{str(i).zfill(2)}.json",
-                    ),
-                    os.path.join(
-                        "bd~bd00.nx",
-                        "bd",
-                        "bd00",
-                        "data",
-                        f"bd00_LuckyMass_Map{str(i).zfill(2)}.json",
-                    ),
-                    os.path.join(
-                        "bd~bd00.nx",
-                        "bd",
-                        "bd00",
-                        "data",
-                        f"bd00_UnluckyMass_Map{str(i).zfill(2)}.json",
-                    ),
-                    os.path.join(
-                        f"bd~bd{str(i).zfill(2)}.nx",
-                        "bd",
-                        f"bd{str(i).zfill(2)}",
-                        "data",
-                        f"bd{str(i).zfill(2)}_MapNode.json",
-                    ),
-                    os.path.join(
-                        f"bd~bd{str(i).zfill(2)}.nx",
-                        "bd",
-                        f"bd{str(i).zfill(2)}",
-                        "data",
-                        f"bd{str(i).zfill(2)}_MapPath.json",
-                    ),
-                    os.path.join(
-                        "bd~bd00.nx",
-                        "bd",
-                        "bd00",
-                        "data",
-                        "bd00_HiddenBlock.json",
-                    ),
-                    os.path.join(
-                        "bd~bd00.nx",
-                        "bd",
-                        "bd00",
-                        "data",
-                        "bd00_PlayerMove.json",
-                    ),
-                ]:
-                    file_path = os.path.join(self.WORKSPACE_PATH, file)
-                    try:
-                        with open(file_path, "r", encoding="utf-8-sig") as json_file:
-                            json.load(json_file)
-                    except Exception as error:
-                        errors.append(f"Cannot Read File {file_path}:\n {error}\n")
-
+            return
+        # Validation + one step per map
+        self.load_progress.config(maximum=len(self.tab_frames) + 1, value=0)
+        self.load_queue = queue.Queue()
+        threading.Thread(
+            target=self.read_workspace_data, args=(self.load_queue,), daemon=True
+        ).start()
+        self.after(LOAD_POLL_MS, self.poll_load_queue)
+
+    def read_workspace_data(self, load_queue):
+        """Loading thread: parse the workspace and queue the results (no Tk calls here)"""
+        try:
+            errors = workspace_data_errors(self.WORKSPACE_PATH)
             if errors:
-                error_message = "\n".join(errors)
+                load_queue.put(("errors", errors))
+                return
+            load_queue.put(("player_move", load_player_move_mapdata(self.WORKSPACE_PATH)))
+            for map_name in self.tab_frames:
+                load_queue.put(("map", map_name, load_map_data(self.WORKSPACE_PATH, map_name)))
+        except Exception as error:
+            load_queue.put(("errors", [f"Cannot Read Workspace:\n {error}\n"]))
+            return
+        load_queue.put(("done",))
+
+    def poll_load_queue(self):
+        """Main thread: apply what the loading thread has read so far"""
+        while True:
+            try:
+                message = self.load_queue.get_nowait()
+            except queue.Empty:
+                break
+            kind = message[0]
+            if kind == "errors":
+                self.load_frame.pack_forget()
+                error_message = "\n".join(message[1])
                 messagebox.showerror(
                     "Error", f"The following errors occurred:\n{error_message}"
                 )
                 return
-            self.load_player_move_parameters()
-            for tab in self.notebook.tabs():
-                tab_widget = self.notebook.nametowidget(tab)
-                tab_widget.load_data()
-            self.save_button.config(state="normal")
-            self.randomize_button.config(state="normal")
+            if kind == "player_move":
+                self.load_player_move_parameters(message[1])
+                self.load_progress.step()
+            elif kind == "map":
+                self.on_map_data_loaded(message[1], message[2])
+            elif kind == "done":
+                self.load_frame.pack_forget()
+                self.data_loaded = True
+                self.save_button.config(state="normal")
+                self.randomize_button.config(state="normal")
+                return
+        self.after(LOAD_POLL_MS, self.poll_load_queue)
+
+    def on_map_data_loaded(self, map_name, map_data):
+        self.map_data[map_name] = map_data
+        tab_frame = self.tab_frames[map_name]
+        self.notebook.tab(tab_frame, state="normal")
+        self.load_progress.step()
+        self.load_label.config(text=f"Loaded {map_items[map_name]['name']}")
+        # Show the first map as soon as it can be used
+        if self.selected_map_name() not in self.map_data:
+            self.notebook.select(tab_frame)
+        if self.selected_map_name() == map_name:
+            self.build_map_tab(map_name)
 
     def save_data(self):
         if not os.path.exists(self.WORKSPACE_PATH):
@@ -612,18 +580,60 @@ class JamboreeMapEditor(tk.Tk):
                     "The Event tab compliance check failed, please check if every rate settings are valid",
                 )
                 return
-            self.save_player_move_parameters()
-            for tab in self.notebook.tabs():
-                tab_widget = self.notebook.nametowidget(tab)
-                tab_widget.save_data()
-            messagebox.showinfo(
-                "Data Saved", "The workspace files has been modified successfuly"
+            # Editors are read here, on the UI thread; serializing and writing
+            # the snapshot happens on a save thread
+            snapshot = SaveSnapshot(self.WORKSPACE_PATH)
+            self.save_player_move_parameters(snapshot.add_json)
+            # Tabs never opened hold no edits: their files are left untouched
+            for tab_widget in self.built_map_tabs():
+                tab_widget.save_data(snapshot.add_json)
+
+            self.save_button.config(state="disabled")
+            self.randomize_button.config(state="disabled")
+            self.save_status_label.config(text=f"Saving {len(snapshot.files)} files...")
+            self.save_queue = queue.Queue()
+            threading.Thread(
+                target=lambda: self.save_queue.put(snapshot.write()), daemon=True
+            ).start()
+            self.after(LOAD_POLL_MS, self.poll_save_queue)
+
+    def poll_save_queue(self):
+        try:
+            report = self.save_queue.get_nowait()
+        except queue.Empty:
+            self.after(LOAD_POLL_MS, self.poll_save_queue)
+            return
+        self.save_button.config(state="normal")
+        self.randomize_button.config(state="normal")
+
+        errors = []
+        written = 0
+        total_time = 0.0
+        for rel_path, result in report.items():
+            if "error" in result:
+                errors.append(f"Cannot Save File {rel_path}:\n {result['error']}\n")
+                continue
+            written += result["written"]
+            total_time += result["serialize"] + result["write"]
+            print(
+                f"[INFO] {rel_path}: serialize {result['serialize'] * 1000:.1f} ms, "
+                f"write {result['write'] * 1000:.1f} ms"
+                + ("" if result["written"] else " (unchanged)")
             )
+        if errors:
+            self.save_status_label.config(text="Save failed")
+            error_message = "\n".join(errors)
+            messagebox.showerror(
+                "Error", f"The following errors occurred:\n{error_message}"
+            )
+            return
+        self.save_status_label.config(
+            text=f"Saved: {written} of {len(report)} files changed ({total_time:.2f} s)"
+        )
 
     def randomize_data(self):
-        for tab in self.notebook.tabs():
-            tab_widget = self.notebook.nametowidget(tab)
-            tab_widget.randomize_data()
+        for map_name in self.map_tabs:
+            self.build_map_tab(map_name).randomize_data()
         messagebox.showinfo(
             "Data Randomized", "The data has been randomized successfuly"
         )
@@ -1,53 +1,9 @@
-import json
-import os
 import random
 import tkinter as tk
 from tkinter import ttk
 
-result_options = {
-    "LuckyMass": [
-        "7Coin",
-        "10Coin",
-        "12Coin",
-        "15Coin",
-        "20Coin",
-        "10CoinTakeMass",
-        "DoubleDice",
-        "WarpBox",
-        "JustDice",
-        "NormalDokan",
-        "ItemBag",
-        "WanwanWhistle",
-        "Kinoko",
-        "ManyKinoko",
-        "SlowKinoko",
-        "ChangeBox",
-        "TripleDice",
-    ],
-    "UnluckyMass": [
-        "Rob3Coin",
-        "Rob5Coin",
-        "Rob7Coin",
-        "Give3Coin",
-        "Give5Coin",
-        "Give7Coin",
-        "GetStone",
-        "GiveItem",
-    ],
-    "KoopaMass": [
-        "Rob10Coin",
-        "Rob15Coin",
-        "Rob20Coin",
-        "Rob30Coin",
-        "RobHalfCoin",
-        "Rob10CoinAll",
-        "Revolution",
-        "Shuffle",
-        "Rob1Star",
-        "Get100Star",
-        "Get1000Coin",
-    ],
-}
+from board_data.events import event_result_options
+from board_data.randomize import randomize_event_data
 
 
 class EventDataManager:
@@ -118,14 +74,7 @@ class EventEditor:
         self.rates_totals = {"Rate0": 0.0, "Rate1": 0.0, "Rate2": 0.0, "Rate3": 0.0}
         self.map_name = map_name.replace(" ", "_")
         self.data_type = data_type
-        self.result_options = result_options.get(self.data_type, [])[:]
-        
-        if self.data_type == "LuckyMass":
-            if self.map_name == "Map02" or self.map_name == "Map06":
-                self.result_options.append("Key")
-            if self.map_name == "Map03":
-                self.result_options.append("Roulette")
-            
+        self.result_options = event_result_options(self.map_name, self.data_type)
 
         self.frame = ttk.Frame(parent)
         self.frame.pack(
@@ -205,27 +154,8 @@ class EventEditor:
         self.event_data_manager.update_event_data(self.map_name, self.data_type, data)
         self.update_event_listbox()
     
-    def randomize_event_data(self): # randomize les entrées a partir de la variable result_options et du self.data_type, les rates ne peuvent pas etre a 0 et ne peuvent pas dépasser 100 chaque rate ne peut pas dépasser un certain pourcentage de l'espace disponible, chaque rate est indépendante des autres
-        rate0 = 0
-        rate1 = 0
-        rate2 = 0
-        rate3 = 0
-        entries = random.sample(self.result_options, 8)
-        self.current_data = []
-        while entries:
-            entry = entries.pop(random.randrange(len(entries)))
-            new_entry = {
-                "Rate0": random.randint(0, (100 - rate0) // 3),
-                "Rate1": random.randint(0, (100 - rate1) // 3),
-                "Rate2": random.randint(0, (100 - rate2) // 3),
-                "Rate3": random.randint(0, (100 - rate3) // 3),
-                "Result": entry,
-            }
-            self.current_data.append(new_entry)
-            rate0 += new_entry["Rate0"]
-            rate1 += new_entry["Rate1"]
-            rate2 += new_entry["Rate2"]
-            rate3 += new_entry["Rate3"]
+    def randomize_event_data(self, rng=random): # randomize les entrées a partir de la variable result_options et du self.data_type, les rates ne peuvent pas etre a 0 et ne peuvent pas dépasser 100 chaque rate ne peut pas dépasser un certain pourcentage de l'espace disponible, chaque rate est indépendante des autres
+        self.current_data = randomize_event_data(self.map_name, self.data_type, rng)
 
         self.event_data_manager.update_event_data(
             self.map_name, self.data_type, self.current_data
@@ -317,48 +247,3 @@ class EventEditor:
 
         except IndexError:
             print("No item selected for removal.")
-
-
-def process_event_data(event_data):
-    results = []
-    for entry in event_data:
-        if all(key in entry for key in ["Rate0", "Rate1", "Rate2", "Rate3", "Result"]):
-            results.append(entry)
-        else:
-            continue
-    return results
-
-
-def load_event_mapdata(base_path, map_name, data_type):
-    event_data = {}
-    raw_event_data = []
-    if data_type == "KoopaMass" and map_name != "Map06":
-        map_name = "Map00"
-    file_name = os.path.join(
-        "bd~bd00.nx", "bd", "bd00", "data", f"bd00_{data_type}_{map_name}.json"
-    )
-    file_path = os.path.join(base_path, file_name)
-
-    try:
-        with open(file_path, "r", encoding="utf-8-sig") as f:
-            data = json.load(f)
-            raw_event_data = data.get(map_name, [])
-    except FileNotFoundError:
-        print(f"File not found: {file_name}")
-    except json.JSONDecodeError:
-        print(f"Error occurred while reading file: {file_name}")
-
-    event_data = process_event_data(raw_event_data)
-    return event_data
-
-
-def save_event_mapdata(base_path, event_data, map_name, data_type):
-    if data_type == "KoopaMass" and map_name != "Map06":
-        map_name = "Map00"
-    file_name = os.path.join(
-        "bd~bd00.nx", "bd", "bd00", "data", f"bd00_{data_type}_{map_name}.json"
-    )
-    file_path = os.path.join(base_path, file_name)
-    with open(file_path, "w", encoding="utf-8-sig") as f:
-        file_data = {map_name: event_data}
-        json.dump(file_data, f, indent=4)
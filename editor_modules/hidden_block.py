@@ -1,38 +1,13 @@
-import os
-import json
 import random
 import tkinter as tk
 from tkinter import ttk
 
-
-LOTS = [
-    {"data": -1, "name": "\u20071 Star"},
-    {"data": 5, "name": "\u20075 Coins"},
-    {"data": 6, "name": "\u20076 Coins"},
-    {"data": 7, "name": "\u20077 Coins"},
-    {"data": 8, "name": "\u20078 Coins"},
-    {"data": 9, "name": "\u20079 Coins"},
-    {"data": 10, "name": "10 Coins"},
-    {"data": 12, "name": "12 Coins"},
-    {"data": 13, "name": "13 Coins"},
-    {"data": 15, "name": "15 Coins"},
-    {"data": 20, "name": "20 Coins"},
-    {"data": 30, "name": "30 Coins"},
-]
-
-
-def get_lot_name_by_data(data):
-    for lot in LOTS:
-        if lot["data"] == data:
-            return lot["name"]
-    return f"Unknown ({data})"
-
-
-def get_lot_data_by_name(name):
-    for lot in LOTS:
-        if lot["name"] == name:
-            return lot["data"]
-    return None
+from board_data.hidden_block import (
+    LOTS,
+    get_lot_name_by_data,
+    get_lot_data_by_name,
+)
+from board_data.randomize import randomize_hiddenblock_data
 
 
 class HiddenBlockDataManager:
@@ -181,17 +156,8 @@ class HiddenBlockEditor:
             )
             self.data_manager.sync_with_linked_maps(self.map_name)
             
-    def randomize_hiddenblock_data(self):
-        num_columns = 6
-        hidden_block_data = []
-        for lot_no in range(num_columns):
-            for lot in LOTS:
-                new_entry = {
-                    "No": lot_no,
-                    "Result": lot["data"],
-                    "Rate": random.randint(0, 255),
-                }
-                hidden_block_data.append(new_entry)
+    def randomize_hiddenblock_data(self, rng=random):
+        hidden_block_data = randomize_hiddenblock_data(rng)
 
         self.data_manager.update_hiddenblock_data(
             self.map_name, hidden_block_data
@@ -268,48 +234,3 @@ class HiddenBlockEditor:
                             {"No": lot_no, "Result": result_data, "Rate": rate}
                         )
         return blocks
-
-
-def process_hiddenblock_data(hiddenblock_data):
-    results = []
-    for entry in hiddenblock_data:
-        if all(key in entry for key in ["Result", "No", "Rate"]):
-            results.append(entry)
-        else:
-            continue
-    return results
-
-
-def load_hiddenblock_mapdata(base_path, map_name):
-    hiddenblock_data = []
-    file_name = os.path.join(
-        "bd~bd00.nx", "bd", "bd00", "data", "bd00_HiddenBlock.json"
-    )
-    file_path = os.path.join(base_path, file_name)
-
-    try:
-        with open(file_path, "r", encoding="utf-8-sig") as f:
-            data = json.load(f)
-            hiddenblock_data = data.get("HiddenBlock", [])
-    except FileNotFoundError:
-        print(f"File not found: {file_name}")
-    except json.JSONDecodeError:
-        print(f"Error occurred while reading file: {file_name}")
-
-    hiddenblock_data = process_hiddenblock_data(hiddenblock_data)
-    return hiddenblock_data
-
-
-def save_hiddenblock_mapdata(base_path, hiddenblock_data, map_name):
-    file_name = os.path.join(
-        "bd~bd00.nx", "bd", "bd00", "data", "bd00_HiddenBlock.json"
-    )
-    file_path = os.path.join(base_path, file_name)
-    try:
-        with open(file_path, "w", encoding="utf-8-sig") as f:
-            file_data = {"HiddenBlock": hiddenblock_data}
-            json.dump(file_data, f, indent=4)
-    except FileNotFoundError:
-        print(f"File not found: {file_name}")
-    except json.JSONDecodeError:
-        print(f"Error occurred while writing to file: {file_name}")
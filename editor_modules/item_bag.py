@@ -1,9 +1,9 @@
-import json
-import os
 import random
 import tkinter as tk
 from tkinter import ttk
 
+from board_data.randomize import randomize_itembag_data
+
 
 class ItemBagEditor:
     def __init__(
@@ -108,32 +108,16 @@ class ItemBagEditor:
             display_text = f"{item['Item']} - {unique}"
             self.phase_frames[phase].listbox.insert(tk.END, display_text)
             
-    def randomize_items(self, add_probability=0.5, unique_probability=0.2):
+    def randomize_items(self, add_probability=0.5, unique_probability=0.2, rng=random):
         for phase in range(2):
             self.phase_frames[phase].listbox.delete(0, tk.END)
 
-            # Prendre 2 items au hasard dans la liste d'items disponible
-            if len(self.combined_items) >= 2:
-                random_items = random.sample(self.combined_items, 2)
-                unique_item = random_items[0]
-                normal_item = random_items[1]
-
-                # Ajouter l'item unique
-                unique_text = f"{unique_item} - Unique"
-                self.phase_frames[phase].listbox.insert(tk.END, unique_text)
-
-                # Ajouter l'item normal
-                normal_text = f"{normal_item} - Not Unique"
-                self.phase_frames[phase].listbox.insert(tk.END, normal_text)
-
-            # Ajouter les items aléatoires avec les probabilités spécifiées
-            for item in self.combined_items:
-                if item not in random_items:
-                    if random.random() < add_probability:
-                        unique = random.random() < unique_probability
-                        unique_text = "Unique" if unique else "Not Unique"
-                        display_text = f"{item} - {unique_text}"
-                        self.phase_frames[phase].listbox.insert(tk.END, display_text)
+        for item in randomize_itembag_data(
+            self.map_name, rng, add_probability, unique_probability
+        ):
+            unique_text = "Unique" if item["Unique"] else "Not Unique"
+            display_text = f"{item['Item']} - {unique_text}"
+            self.phase_frames[item["Phase"]].listbox.insert(tk.END, display_text)
                     
     def save_items(self):
         items = []
@@ -146,45 +130,3 @@ class ItemBagEditor:
                 items.append({"Item": item_name, "Phase": phase, "Unique": int(unique)})
         self.data_store[self.map_name] = items
         return items
-
-
-def process_itembag_data(item_data, data_key):
-    results = []
-    for entry in item_data:
-        if all(key in entry for key in ["Item", "Phase", "Unique"]):
-            results.append(entry)
-        else:
-            continue
-    return results
-
-
-def load_itembag_mapdata(base_path, map_name):
-    item_bag_data = {}
-    item_bag_raw_data = []
-    file_name = os.path.join(
-        "bd~bd00.nx", "bd", "bd00", "data", f"bd00_ItemBag_{map_name}.json"
-    )
-    file_path = os.path.join(base_path, file_name)
-    try:
-        with open(file_path, "r", encoding="utf-8-sig") as f:
-            data = json.load(f)
-            item_bag_raw_data = data.get(map_name)
-    except FileNotFoundError:
-        print(f"File not found : {file_name}")
-    except json.JSONDecodeError:
-        print(f"Error occurred while reading file : {file_name}")
-
-    item_bag_data[map_name] = process_itembag_data(item_bag_raw_data, "ItemBag")
-    return item_bag_data
-
-
-def save_itembag_mapdata(base_path, item_bag_data, map_name):
-    file_name = os.path.join(
-        "bd~bd00.nx", "bd", "bd00", "data", f"bd00_ItemBag_{map_name}.json"
-    )
-    file_path = os.path.join(base_path, file_name)
-    with open(file_path, "w", encoding="utf-8-sig") as f:
-        file_data = {}
-        file_data[f"{map_name}"] = []
-        file_data[f"{map_name}"] = item_bag_data
-        json.dump(file_data, f, indent=4)
@@ -1,9 +1,9 @@
-import json
-import os
 import random
 import tkinter as tk
 from tkinter import ttk
 
+from board_data.randomize import randomize_itemmass_data
+
 
 class ItemMassEditor:
     def __init__(
@@ -101,16 +101,18 @@ class ItemMassEditor:
                 else:
                     print(f"Lot number {lot_number} does not exist in self.lots.")
                     
-    def randomize_items(self, probability=0.2):
+    def randomize_items(self, probability=0.2, rng=random):
         for lot_no, widgets in self.lots.items():
             listbox = widgets.get("listbox")
             if listbox:
                 listbox.delete(0, tk.END)
-                for item in self.combined_items:
-                    if random.random() < probability:
-                        listbox.insert(tk.END, item)
             else:
                 print(f"Listbox for Lot {lot_no} is not available")
+
+        for item in randomize_itemmass_data(self.map_name, rng, probability):
+            listbox = self.lots[item["No"]].get("listbox")
+            if listbox:
+                listbox.insert(tk.END, item["Item"])
             
 
     def save_items(self):
@@ -131,45 +133,3 @@ class ItemMassEditor:
 
         self.data_store[self.map_name] = items
         return items
-
-
-def process_itemmass_data(item_data):
-    results = []
-    for entry in item_data:
-        if all(key in entry for key in ["Item", "No"]):
-            results.append(entry)
-        else:
-            continue
-    return results
-
-
-def load_itemmass_mapdata(base_path, map_name):
-    item_mass_data = {}
-    item_mass_raw_data = []
-    file_name = os.path.join(
-        "bd~bd00.nx", "bd", "bd00", "data", f"bd00_ItemMass_{map_name}.json"
-    )
-    file_path = os.path.join(base_path, file_name)
-    try:
-        with open(file_path, "r", encoding="utf-8-sig") as f:
-            data = json.load(f)
-            item_mass_raw_data = data.get(map_name)
-    except FileNotFoundError:
-        print(f"File not found : {file_name}")
-    except json.JSONDecodeError:
-        print(f"Error occurred while reading file : {file_name}")
-
-    item_mass_data[map_name] = process_itemmass_data(item_mass_raw_data)
-    return item_mass_data
-
-
-def save_itemmass_mapdata(base_path, item_mass_data, map_name):
-    file_name = os.path.join(
-        "bd~bd00.nx", "bd", "bd00", "data", f"bd00_ItemMass_{map_name}.json"
-    )
-    file_path = os.path.join(base_path, file_name)
-    with open(file_path, "w", encoding="utf-8-sig") as f:
-        file_data = {}
-        file_data[f"{map_name}"] = []
-        file_data[f"{map_name}"] = item_mass_data
-        json.dump(file_data, f, indent=4)
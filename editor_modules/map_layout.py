@@ -1,14 +1,15 @@
 import random
 import tkinter as tk
 from tkinter import ttk
-import json
-import os
 from matplotlib import patheffects
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyArrowPatch, Circle, Polygon
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 
+from board_data.map_layout import mass_attr_list
+from board_data.randomize import randomize_map_layout_data
+
 
 mass_attr_colors = {
     "Item": "forestgreen",
@@ -28,19 +29,6 @@ mass_attr_colors = {
     "SpotBranchKey": "yellow",
 }
 
-mass_attr_list = [
-    "Item",
-    "Chance",
-    "Plus",
-    "Minus",
-    "Lucky",
-    "Unlucky",
-    "VS",
-    "Koopa",
-    # "Happening","SpotItemShopNokonoko", "SpotItemShopKameck", "SpotBranch", "SpotEvent", "SpotBranchKey", "SpotTeresa"
-]
-
-
 class MapLayoutEditor:
     def __init__(
         self,
@@ -404,63 +392,9 @@ class MapLayoutEditor:
     def load_data(self, map_layout_data):
         self.map_layout_data = map_layout_data
         self.draw_map()
-    def randomize_data(self):  # verify if node["MassAttr"] is in mass_attr_list
-        for node in self.map_layout_data["MapNode"]:
-            if self.map_index != 7 or node["NodeNo"] not in range(59, 67):
-                if node["MassAttr"] in mass_attr_list and node["NpcNodeNo0"] == -1:
-                    node["MassAttr"] = random.choice(mass_attr_list)
+    def randomize_data(self, rng=random):
+        randomize_map_layout_data(self.map_name, self.map_layout_data, rng)
         self.draw_map()
 
     def save_data(self):
         return self.map_layout_data
-
-
-def get_file_path(file_type, workspace_path, map_name):
-    map_index = int(map_name.replace("Map", ""))
-    file_name = f"bd{map_index:02d}_{file_type}.json"
-    base_path = os.path.join(
-        workspace_path,
-        f"bd~bd{map_index:02d}.nx",
-        "bd",
-        f"bd{map_index:02d}",
-        "data",
-    )
-    return os.path.join(base_path, file_name)
-
-
-def load_map_layout_mapdata(workspace_path, map_name):
-    file_path_nodes = get_file_path("MapNode", workspace_path, map_name)
-    file_path_path = get_file_path("MapPath", workspace_path, map_name)
-
-    try:
-        with open(file_path_nodes, "r", encoding="utf-8-sig") as file:
-            data_nodes = json.load(file)
-        with open(file_path_path, "r", encoding="utf-8-sig") as file:
-            data_path = json.load(file)
-
-        map_layout_data = {
-            "MapNode": data_nodes["MapNode"],
-            "MapPath": data_path["MapPath"],
-        }
-        return map_layout_data
-    except FileNotFoundError as e:
-        print(f"Error occurred while reading file : {e}")
-    return {"MapNode": [], "MapPath": []}
-
-
-def save_map_layout_mapdata(workspace_path, map_name, map_layout_data):
-    file_path_nodes = get_file_path("MapNode", workspace_path, map_name)
-    file_path_path = get_file_path("MapPath", workspace_path, map_name)
-
-    data_nodes = {"MapNode": map_layout_data["MapNode"]}
-    data_path = {"MapPath": map_layout_data["MapPath"]}
-
-    try:
-        with open(file_path_nodes, "w", encoding="utf-8-sig") as file:
-            json.dump(data_nodes, file, ensure_ascii=False, indent=4)
-
-        with open(file_path_path, "w", encoding="utf-8-sig") as file:
-            json.dump(data_path, file, ensure_ascii=False, indent=4)
-
-    except FileNotFoundError as e:
-        print(f"Error occurred while writing file : {e}")
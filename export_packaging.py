@@ -0,0 +1,149 @@
+import os
+import shutil
+import zipfile
+
+from bea_archive_manager import bea_archives_repacker
+from workspace_journal import diff_workspace
+
+GAME_TITLE_ID = "0100965017338000"
+
+
+def package_layouts(mod_name):
+    """romfs folder of every supported mod-manager layout, relative to the export root"""
+    return {
+        "SMM": os.path.join(
+            "Simple Mod Manager (SMM)",
+            "mods",
+            "Super Mario Party Jamboree",
+            mod_name,
+            "contents",
+            GAME_TITLE_ID,
+            "romfs",
+        ),
+        "RYUJINX": os.path.join(
+            "RYUJINX", "mods", "contents", GAME_TITLE_ID, mod_name, "romfs"
+        ),
+        "YUZU": os.path.join("YUZU", "load", GAME_TITLE_ID, mod_name, "romfs"),
+    }
+
+
+def _iter_files(directory):
+    for current_root, _, file_list in os.walk(directory):
+        for file_name in sorted(file_list):
+            file_path = os.path.join(current_root, file_name)
+            yield file_path, os.path.relpath(file_path, directory)
+
+
+def _reflink(src, dst):
+    """Copy-on-write clone (Linux FICLONE); raises OSError where unsupported"""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("reflink not supported on this platform")
+    FICLONE = 0x40049409
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.remove(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+def link_or_copy(src, dst):
+    """Materialize src at dst without duplicating data when the filesystem allows.
+
+    Tries a hardlink, then a reflink, then falls back to a regular copy.
+    Returns the method used ("hardlink", "reflink" or "copy").
+    """
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        pass
+    try:
+        _reflink(src, dst)
+        return "reflink"
+    except OSError:
+        pass
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def materialize_layouts(romfs_dir, output_path, mod_name):
+    """Expose the romfs written once in romfs_dir under every mod-manager layout.
+
+    Returns {method: file count}.
+    """
+    methods = {}
+    layouts = package_layouts(mod_name).values()
+    for file_path, rel_path in _iter_files(romfs_dir):
+        for layout in layouts:
+            method = link_or_copy(file_path, os.path.join(output_path, layout, rel_path))
+            methods[method] = methods.get(method, 0) + 1
+    return methods
+
+
+def write_zip_bundle(romfs_dir, zip_path, mod_name):
+    """Stream every mod-manager layout into one zip (files are never held in memory).
+
+    Archives are stored as-is: their payloads are already zstd compressed.
+    """
+    layouts = package_layouts(mod_name).values()
+    tmp_path = zip_path + ".tmp"
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as bundle:
+        for file_path, rel_path in _iter_files(romfs_dir):
+            for layout in layouts:
+                arcname = os.path.join(layout, rel_path).replace(os.sep, "/")
+                bundle.write(file_path, arcname)
+    os.replace(tmp_path, zip_path)
+
+
+def repack_instructions(workspace_path, core_dir):
+    """Repack instructions for every workspace file that differs from CORE.
+
+    Hash-indexed diff: unchanged files are not read (see workspace_journal).
+    """
+    instructions = {}
+    for relative_file_path in diff_workspace(workspace_path, core_dir):
+        parts = relative_file_path.split(os.sep)
+        bea_name = parts[0]
+        inner_rel = os.path.join(*parts[1:])
+
+        if bea_name not in instructions:
+            instructions[bea_name] = []
+
+        instructions[bea_name].append(
+            {
+                "source": os.path.join(workspace_path, relative_file_path),
+                "destination": inner_rel,
+            }
+        )
+    return instructions
+
+
+def export_workspace(
+    workspace_path, core_dir, base_path, output_dir, layout_folders=True, zip_bundle=False
+):
+    """Repack the workspace into output_dir/<workspace>/romfs and package it.
+
+    Returns the bea_archives_repacker code (0 on success).
+    """
+    mod_name = os.path.basename(os.path.normpath(workspace_path))
+    output_path = os.path.join(output_dir, mod_name)
+    if os.path.exists(output_path):
+        shutil.rmtree(output_path)
+    os.makedirs(output_path, exist_ok=True)
+
+    instructions = repack_instructions(workspace_path, core_dir)
+    repack = bea_archives_repacker(instructions, base_path, output_path)
+    if repack == 0:
+        # Archives are written once to romfs, every layout links to them
+        romfs_path = os.path.join(output_path, "romfs")
+        if layout_folders:
+            materialize_layouts(romfs_path, output_path, mod_name)
+        if zip_bundle:
+            write_zip_bundle(romfs_path, output_path + ".zip", mod_name)
+    return repack
@@ -0,0 +1,64 @@
+"""JSON parsing/serialization for board data files, with an optional fast parser.
+
+Files are UTF-8 with a BOM, written as json.dump(..., indent=4) to a text file
+always did. orjson (pip install orjson) is only used to parse: the stdlib C
+encoder handles indent itself on the pinned Python (3.13), so serialization
+always goes through json.dumps and checksums and journal digests never change.
+"""
+import codecs
+import json
+import os
+
+try:
+    import orjson  # optional: pip install orjson
+except ImportError:
+    orjson = None
+
+# ----------------------------------------------------------------------
+# Settings
+# ----------------------------------------------------------------------
+
+BACKENDS = ["orjson", "json"] if orjson is not None else ["json"]
+# Backend used by loads; see use_backend
+backend = BACKENDS[0]
+_LINESEP = os.linesep.encode()
+
+
+def use_backend(name):
+    """Select the parser ("orjson" or "json") for later loads calls"""
+    global backend
+    if name not in BACKENDS:
+        raise ValueError(f"JSON backend not available: {name} (available: {BACKENDS})")
+    backend = name
+
+
+# ----------------------------------------------------------------------
+# Parsing
+# ----------------------------------------------------------------------
+
+def loads(raw):
+    """Parse file bytes (BOM optional); raises ValueError like json.loads"""
+    if backend == "orjson":
+        try:
+            return orjson.loads(raw[3:] if raw.startswith(codecs.BOM_UTF8) else raw)
+        except orjson.JSONDecodeError:
+            # NaN, integers beyond 64 bits...: let the stdlib decide
+            pass
+    return json.loads(raw.decode("utf-8-sig"))
+
+
+def load_file(file_path):
+    with open(file_path, "rb") as f:
+        return loads(f.read())
+
+
+# ----------------------------------------------------------------------
+# Serialization
+# ----------------------------------------------------------------------
+
+def dumps_bytes(data, **dump_kwargs):
+    """Bytes json.dump(data, **dump_kwargs) writes to a "w", utf-8-sig text file"""
+    content = json.dumps(data, **dump_kwargs).encode("utf-8")
+    if _LINESEP != b"\n":
+        content = content.replace(b"\n", _LINESEP)
+    return codecs.BOM_UTF8 + content
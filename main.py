@@ -1,99 +1,45 @@
-import filecmp
-import json
 import os
 import os
 import sys
-import hashlib
-import shutil
-import re
+import multiprocessing
 import tkinter as tk
 import traceback
 from tkinter import ttk, messagebox, simpledialog
 
-from bea_archive_manager import (
-    bea_archives_extractor,
-    bea_archives_repacker,
-    is_bea_lib_available,
-    download_bea_lib_latest_via_curl,
+from app_config import (
+    BASE_PATH,
+    CORE_DIR,
+    EXPECTED_CORE_CHECKSUMS,
+    EXPECTED_CORE_MERKLE_ROOTS,
+    EXPORT_LAYOUT_FOLDERS,
+    EXPORT_ZIP_BUNDLE,
+    OUTPUT_DIR,
+    REQUIRED_BEA_FILES,
+    ROMFS_DIR,
+    WORKSPACE_DIR,
 )
+from bea_archive_manager import bea_archives_extractor
+from core_integrity import core_checksum, repair_core_json
 from editor import JamboreeMapEditor
-
-if getattr(sys, "frozen", False):
-    BASE_PATH = os.path.dirname(sys.executable)
-else:
-    BASE_PATH = os.path.dirname(os.path.abspath(__file__))
-
-CORE_DIR = os.path.join(BASE_PATH, "CORE")
-ROMFS_DIR = os.path.join(BASE_PATH, "ROMFS")
-WORKSPACE_DIR = os.path.join(BASE_PATH, "workspace")
-OUTPUT_DIR = os.path.join(BASE_PATH, "output")
-
-REQUIRED_BEA_FILES = [
-    "bd~bd00.nx",
-    "bd~bd01.nx",
-    "bd~bd02.nx",
-    "bd~bd03.nx",
-    "bd~bd04.nx",
-    "bd~bd05.nx",
-    "bd~bd06.nx",
-    "bd~bd07.nx",
-]
-
-EXPECTED_CORE_CHECKSUMS = {
-    "a2cdc050aa73b3c0d29e790a8a0fd1df500cf524eab365d427df56c2303c1756": "1.0.0 <=> 2.2.0"
-}
+from export_packaging import export_workspace as export_workspace_files
+from workspace_overlay import create_overlay_workspace
 
 # Global variable to track main menu window
 main_window = None
 
-def calculate_checksum_for_directory(directory):
-    sha256 = hashlib.sha256()
-    for root, _, files in sorted(os.walk(directory)):
-        for file in sorted(files):
-            file_path = os.path.join(root, file)
-            with open(file_path, "rb") as f:
-                while chunk := f.read(8192):
-                    sha256.update(chunk)
-    return sha256.hexdigest()
-
 def correct_and_verify_core_integrity(STE=False):
     if not os.path.exists(CORE_DIR):
         os.mkdir(CORE_DIR)
         for bea_folder in REQUIRED_BEA_FILES:
             os.makedirs(os.path.join(CORE_DIR, bea_folder), exist_ok=True)
 
-    # Correction JSON
-    for root, _, files in os.walk(CORE_DIR):
-        for file in files:
-            if file.endswith(".json"):
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, "r", encoding="utf-8-sig") as json_file:
-                        content = json_file.read()
-
-                    content_fixed = re.sub(r",\s*(\]|\})", r"\1", content)
-                    content_fixed = re.sub(r"(?<=\})(?=\s*,)", r"", content_fixed)
-                    content_fixed = re.sub(r"\}[^}]*$", r"}", content_fixed)
-
-                    try:
-                        json_data = json.loads(content_fixed)
-                    except json.JSONDecodeError as error:
-                        raise ValueError(
-                            f"Failed to load JSON file after correction: {file_path}\n"
-                            f"Error: {error}"
-                        )
+    # Correction JSON (only files that are invalid or not normalized are rewritten)
+    repaired, normalized = repair_core_json(CORE_DIR)
+    if repaired or normalized:
+        print(f"CORE JSON check: {repaired} file(s) repaired, {normalized} file(s) normalized")
 
-                    with open(file_path, "w", encoding="utf-8-sig") as json_file:
-                        json.dump(json_data, json_file, indent=4, ensure_ascii=False)
-
-                except json.JSONDecodeError as error:
-                    raise ValueError(
-                        f"Failed to correct or load JSON file: {file_path}\n"
-                        f"Error: {error}"
-                    )
-
-    # Checksum CORE
-    calculated_checksum = calculate_checksum_for_directory(CORE_DIR)
+    # Checksum CORE (incremental, see core_integrity)
+    calculated_checksum = core_checksum(CORE_DIR, known_roots=EXPECTED_CORE_MERKLE_ROOTS)
 
     valid_checksum = False
     valid_checksums_text = "Checksum valides :\n"
@@ -105,27 +51,10 @@ def correct_and_verify_core_integrity(STE=False):
             valid_checksum = True
 
     if not valid_checksum:
-        lib_ok = is_bea_lib_available()
-
-        # Tentative de download auto si la lib manque
-        if not lib_ok:
-            if messagebox.askyesno(
-                "BEA Library missing",
-                "BezelEngineArchive_Lib.dll is missing.\n"
-                "Do you want to automatically download the latest release from GitHub (via curl)?",
-            ):
-                if download_bea_lib_latest_via_curl():
-                    lib_ok = is_bea_lib_available()
-                else:
-                    messagebox.showerror(
-                        "Download failed",
-                        "Automatic download failed. Please download manually from GitHub.\n"
-                        "https://github.com/KillzXGaming/BEA-Library-Editor/releases",
-                    )
-
+        # Archives are read natively; BezelEngineArchive_Lib is only fetched
+        # (with a [WARN]) if one of them cannot be, see bea_archive_manager
         if (
             STE is False
-            and lib_ok
             and os.path.isdir(ROMFS_DIR)
             and bool(os.listdir(ROMFS_DIR))
         ):
@@ -175,10 +104,9 @@ def correct_and_verify_core_integrity(STE=False):
                 "The automatic game files integrity check failed (Files are missing or damaged)\n"
                 "\n"
                 "To correctly integrate the game files into this folder:\n"
-                "- Ensure BezelEngineArchive_Lib.dll is present in the BezelEngineArchive_Lib folder\n"
                 "- Copy the content of the romfs of Super Mario Party Jamboree into the ROMFS Folder (Not ROMFS/romfs)\n"
                 "- Launch SMPJ Map Editor again to let it extract bd~bd00.nx.bea to bd~bd07.nx.bea\n"
-                "  into the related folders in CORE using the BEA-Library-Editor backend.\n"
+                "  into the related folders in CORE.\n"
                 "\n"
                 f"Actual checksum: {calculated_checksum}\n"
                 f"{valid_checksums_text}\n"
@@ -205,7 +133,8 @@ def create_workspace():
                 raise FileExistsError(
                     f"A workspace with this name already exists: {workspace_name}"
                 )
-            shutil.copytree(CORE_DIR, workspace_path)
+            # Overlay workspace: stores only edited files, reads fall back to CORE
+            create_overlay_workspace(CORE_DIR, workspace_path)
             messagebox.showinfo("Success", f"Workspace created: {workspace_path}")
             return workspace_path
         except Exception as e:
@@ -275,77 +204,17 @@ def show_main_menu(current_root=None):
         workspaces = update_workspace_list()
         if workspace in workspaces:
             workspace_path = os.path.join(WORKSPACE_DIR, workspace)
-            output_path = os.path.join(OUTPUT_DIR, workspace)
-            packages_path_list = [
-                os.path.join(
-                    output_path,
-                    "Simple Mod Manager (SMM)",
-                    "mods",
-                    "Super Mario Party Jamboree",
-                    workspace,
-                    "contents",
-                    "0100965017338000",
-                    "romfs",
-                ),
-                os.path.join(
-                    output_path,
-                    "RYUJINX",
-                    "mods",
-                    "contents",
-                    "0100965017338000",
-                    workspace,
-                    "romfs",
-                ),
-                os.path.join(
-                    output_path,
-                    "YUZU",
-                    "load",
-                    "0100965017338000",
-                    workspace,
-                    "romfs",
-                ),
-            ]
-            if os.path.exists(output_path):
-                shutil.rmtree(output_path)
-            os.makedirs(output_path, exist_ok=True)
-
-            instructions = {}
-            for current_root, _, file_list in os.walk(workspace_path):
-                for file_name in file_list:
-                    modified_file_path = os.path.join(current_root, file_name)
-                    relative_file_path = os.path.relpath(
-                        modified_file_path, workspace_path
-                    )
-                    original_file_path = os.path.join(CORE_DIR, relative_file_path)
-
-                    if not os.path.exists(original_file_path) or not filecmp.cmp(
-                        original_file_path, modified_file_path, shallow=False
-                    ):
-                        parts = relative_file_path.split(os.sep)
-                        bea_name = parts[0]
-                        inner_rel = os.path.join(*parts[1:])
-
-                        if bea_name not in instructions:
-                            instructions[bea_name] = []
-
-                        instructions[bea_name].append(
-                            {
-                                "source": modified_file_path,
-                                "destination": inner_rel,
-                            }
-                        )
-
-            repack = bea_archives_repacker(instructions, BASE_PATH, output_path)
+            repack = export_workspace_files(
+                workspace_path,
+                CORE_DIR,
+                BASE_PATH,
+                OUTPUT_DIR,
+                layout_folders=EXPORT_LAYOUT_FOLDERS,
+                zip_bundle=EXPORT_ZIP_BUNDLE,
+            )
 
             match repack:
                 case 0:
-                    for root, dirs, files in os.walk(os.path.join(output_path, "romfs")):
-                        for name in files:
-                            if name.endswith(".work"):
-                                file_path = os.path.join(root, name)
-                                os.remove(file_path)
-                    for folder in packages_path_list:
-                        shutil.copytree(os.path.join(output_path, "romfs"), folder)
                     messagebox.showinfo("Finished", "Exportation finished")
                 case 1:
                     messagebox.showwarning(
@@ -387,38 +256,19 @@ def show_main_menu(current_root=None):
         pady=5
     )
 
-    lib_ok = is_bea_lib_available()
     romfs_ok = os.path.isdir(ROMFS_DIR) and bool(os.listdir(ROMFS_DIR))
 
-    if lib_ok and romfs_ok:
+    if romfs_ok:
         tk.Button(
             root, text="Export Workspace", command=export_workspace, width=100
         ).pack(pady=5)
     else:
         def missing_dep_warning():
-            if not lib_ok:
-                if messagebox.askyesno(
-                    "BEA Library missing",
-                    "BezelEngineArchive_Lib.dll is missing.\n"
-                    "Do you want to automatically download the latest release from GitHub (via curl)?",
-                ):
-                    if download_bea_lib_latest_via_curl():
-                        messagebox.showinfo(
-                            "Download complete",
-                            "Download finished. Please restart SMPJ Map Editor.",
-                        )
-                    else:
-                        messagebox.showerror(
-                            "Download failed",
-                            "Automatic download failed. Please download manually:\n"
-                            "https://github.com/KillzXGaming/BEA-Library-Editor/releases",
-                        )
-            elif not romfs_ok:
-                messagebox.showerror(
-                    "ROMFS missing",
-                    "ROMFS folder is missing or empty.\n"
-                    "Please copy the game romfs content into the ROMFS folder.",
-                )
+            messagebox.showerror(
+                "ROMFS missing",
+                "ROMFS folder is missing or empty.\n"
+                "Please copy the game romfs content into the ROMFS folder.",
+            )
 
         tk.Button(
             root,
@@ -430,6 +280,7 @@ def show_main_menu(current_root=None):
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller: extraction worker processes
     try:
         ensure_directories()
         show_main_menu()  # Single call, handles loop internally
@@ -0,0 +1,45 @@
+import copy
+import time
+
+from workspace_journal import JournalBatch, json_bytes
+
+
+class SaveSnapshot:
+    """Workspace files to save, captured from the editors on the UI thread.
+
+    add_json has the signature of write_workspace_json, so it can be passed as
+    the write_json of the board_data save functions. Data is deep-copied when
+    added; write() serializes and writes it later, on any thread.
+    """
+
+    def __init__(self, workspace_path):
+        self.workspace_path = workspace_path
+        self.files = {}
+
+    def add_json(self, workspace_path, rel_path, data, **dump_kwargs):
+        if workspace_path != self.workspace_path:
+            raise ValueError(f"{rel_path} belongs to another workspace: {workspace_path}")
+        self.files[rel_path] = (copy.deepcopy(data), dump_kwargs)
+
+    def write(self):
+        """Serialize and atomically write every file (one journal update).
+
+        Returns {rel_path: {"written", "serialize", "write"} or {"error"}},
+        times in seconds; a failing file does not stop the others.
+        """
+        report = {}
+        with JournalBatch(self.workspace_path) as batch:
+            for rel_path, (data, dump_kwargs) in self.files.items():
+                try:
+                    start = time.perf_counter()
+                    content = json_bytes(data, **dump_kwargs)
+                    serialized = time.perf_counter()
+                    written = batch.write(rel_path, content, data)
+                    report[rel_path] = {
+                        "written": written,
+                        "serialize": round(serialized - start, 6),
+                        "write": round(time.perf_counter() - serialized, 6),
+                    }
+                except Exception as error:
+                    report[rel_path] = {"error": str(error)}
+        return report
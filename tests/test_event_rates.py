@@ -0,0 +1,24 @@
+import unittest
+
+import numpy as np
+
+from board_data.event_rates import sample_rate_tables
+
+
+class SampleRateTablesTest(unittest.TestCase):
+    def test_totals_equal_to_summed_caps(self):
+        # Every row ends fully capped: nothing may be redrawn over 0 open entries
+        tables = sample_rate_tables(
+            5, entries=8, gen=np.random.default_rng(3), min_total=96, max_total=96, max_rate=12
+        )
+        self.assertTrue((tables == 12).all())
+
+    def test_default_bounds(self):
+        tables = sample_rate_tables(500, gen=np.random.default_rng(1))
+        totals = tables.sum(axis=1)
+        self.assertTrue(((totals >= 50) & (totals <= 100)).all())
+        self.assertTrue(((tables >= 0) & (tables <= 33)).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from tqdm import tqdm
+
+import bea_codec
+from board_data.randomize import randomize_workspace
+from workspace_overlay import create_overlay_workspace, is_overlay
+
+
+def variant_name(prefix, index):
+    return f"{prefix}_{index:04d}"
+
+
+def _generate_variant(task):
+    """Worker: one overlay workspace randomized with its seed, optionally exported"""
+    workspace_path = os.path.join(task["workspace_dir"], task["name"])
+    result = {"name": task["name"], "seed": task["seed"], "exit_code": 0, "timings": {}}
+    start = time.perf_counter()
+    try:
+        if os.path.exists(workspace_path):
+            # Only overlay workspaces are disposable, never a full copy
+            if not (task["overwrite"] and is_overlay(workspace_path)):
+                raise FileExistsError(f"Workspace already exists: {workspace_path}")
+            shutil.rmtree(workspace_path)
+        create_overlay_workspace(task["core_dir"], workspace_path)
+        randomize_workspace(workspace_path, task["map_names"], task["seed"])
+        result["timings"]["randomize"] = round(time.perf_counter() - start, 6)
+
+        if task["export"]:
+            from export_packaging import export_workspace
+
+            export_start = time.perf_counter()
+            result["exit_code"] = export_workspace(
+                workspace_path,
+                task["core_dir"],
+                task["base_path"],
+                task["output_dir"],
+                layout_folders=task["layout_folders"],
+                zip_bundle=task["zip_bundle"],
+            )
+            result["timings"]["export"] = round(time.perf_counter() - export_start, 6)
+    except Exception as e:
+        result["exit_code"] = 2
+        result["error"] = str(e)
+    result["timings"]["total"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def generate_variants(
+    prefix,
+    count,
+    base_seed,
+    core_dir,
+    workspace_dir,
+    map_names=None,
+    export=False,
+    base_path=None,
+    output_dir=None,
+    layout_folders=True,
+    zip_bundle=False,
+    workers=None,
+    overwrite=False,
+):
+    """Generate count randomized workspaces <prefix>_NNNN across worker processes.
+
+    Variant i uses seed base_seed + i, so any variant can be rebuilt alone
+    with `cli.py randomize --seed`. Returns one result dict per variant,
+    in index order.
+    """
+    tasks = [
+        {
+            "name": variant_name(prefix, index),
+            "seed": base_seed + index,
+            "core_dir": core_dir,
+            "workspace_dir": workspace_dir,
+            "map_names": map_names,
+            "export": export,
+            "base_path": base_path,
+            "output_dir": output_dir,
+            "layout_folders": layout_folders,
+            "zip_bundle": zip_bundle,
+            "overwrite": overwrite,
+        }
+        for index in range(count)
+    ]
+    os.makedirs(workspace_dir, exist_ok=True)
+
+    workers = min(workers or os.cpu_count() or 1, max(1, count))
+    results = {}
+    if workers <= 1:
+        for task in tqdm(tasks, desc="Generating variants", unit="variant"):
+            results[task["name"]] = _generate_variant(task)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=bea_codec.configure_process_worker,
+            initargs=(workers,),
+        ) as pool:
+            futures = [pool.submit(_generate_variant, task) for task in tasks]
+            for future in tqdm(
+                as_completed(futures), total=len(futures), desc="Generating variants", unit="variant"
+            ):
+                result = future.result()
+                results[result["name"]] = result
+
+    for result in results.values():
+        if result["exit_code"] != 0:
+            print(f"[ERR] {result['name']} (seed {result['seed']}): {result.get('error', 'export failed')}")
+    return [results[task["name"]] for task in tasks]
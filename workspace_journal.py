@@ -0,0 +1,262 @@
+import hashlib
+import json
+import os
+import threading
+
+from core_integrity import core_manifest_path, load_manifest
+from json_codec import dumps_bytes
+from workspace_overlay import (
+    METADATA_PREFIX,
+    iter_workspace_files,
+    overlay_base,
+    resolve_read_path,
+    resolve_write_path,
+)
+from workspace_store import load_json_document
+
+# Per-workspace record of the files written in it:
+# {relative path: {"size", "mtime_ns", "sha256"}}
+JOURNAL_NAME = METADATA_PREFIX + "journal.json"
+JOURNAL_VERSION = 1
+
+_journal_lock = threading.Lock()
+
+# CORE manifest records per manifest path: (mtime_ns, size, files)
+_core_records = {}
+_core_records_lock = threading.Lock()
+
+
+def _key(rel_path):
+    return rel_path.replace(os.sep, "/")
+
+
+def _hash_file(file_path):
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def load_journal(workspace_path):
+    try:
+        with open(os.path.join(workspace_path, JOURNAL_NAME), "r", encoding="utf-8") as f:
+            journal = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if journal.get("version") != JOURNAL_VERSION:
+        return {}
+    return journal.get("files", {})
+
+
+def save_journal(workspace_path, files):
+    journal_path = os.path.join(workspace_path, JOURNAL_NAME)
+    tmp_path = journal_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": JOURNAL_VERSION, "files": files}, f, indent=1)
+        os.replace(tmp_path, journal_path)
+    except OSError as error:
+        print(f"Cannot write workspace journal {journal_path}:\n {error}\n")
+
+
+def core_file_records(core_dir):
+    """Per-file records of the CORE integrity manifest ({} without one).
+
+    Parsed once and served again while the manifest's mtime and size are
+    unchanged, like workspace_store does for documents. Shared: do not modify.
+    """
+    manifest_path = core_manifest_path(core_dir)
+    try:
+        stat = os.stat(manifest_path)
+    except OSError:
+        return {}
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _core_records_lock:
+        cached = _core_records.get(manifest_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    files = load_manifest(manifest_path).get("files", {})
+    with _core_records_lock:
+        _core_records[manifest_path] = (signature, files)
+    return files
+
+
+def _stat_record(file_path, digest):
+    stat = os.stat(file_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+
+
+def _matches(record, file_path):
+    if not record:
+        return False
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return False
+    return record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns
+
+
+def _current_digest(workspace_path, rel_path, journal):
+    """SHA-256 of what reading rel_path returns now (workspace copy, else CORE)"""
+    key = _key(rel_path)
+    own_path = os.path.join(workspace_path, rel_path)
+    if os.path.exists(own_path):
+        record = journal.get(key)
+        if _matches(record, own_path):
+            return record["sha256"]
+        return _hash_file(own_path)
+
+    core_dir = overlay_base(workspace_path)
+    if core_dir is None:
+        return None
+    core_path = os.path.join(core_dir, rel_path)
+    if not os.path.exists(core_path):
+        return None
+    core_record = core_file_records(core_dir).get(key)
+    if _matches(core_record, core_path):
+        return core_record["sha256"]
+    return _hash_file(core_path)
+
+
+def replace_file_atomic(file_path, content):
+    """Write content (bytes) to file_path.tmp, then swap it in with os.replace.
+
+    An interrupted save leaves the previous file intact, never a truncated one.
+    Callers serialize writes to the same path (see _journal_lock).
+    """
+    tmp_path = file_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _same_document(workspace_path, rel_path, data):
+    """True if the file currently read for rel_path parses to data"""
+    try:
+        return load_json_document(resolve_read_path(workspace_path, rel_path)) == data
+    except (OSError, ValueError):
+        return False
+
+
+class JournalBatch:
+    """Several workspace writes sharing one journal load and one journal save.
+
+    Holds _journal_lock from __enter__ to __exit__; the journal is saved on
+    exit if a file was written. write_json has the signature of
+    write_workspace_json, so it can be passed to the board_data save functions.
+    """
+
+    def __init__(self, workspace_path):
+        self.workspace_path = workspace_path
+        self.journal = None
+        self.dirty = False
+
+    def __enter__(self):
+        _journal_lock.acquire()
+        try:
+            self.journal = load_journal(self.workspace_path)
+        except BaseException:
+            _journal_lock.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self.dirty:
+                save_journal(self.workspace_path, self.journal)
+        finally:
+            _journal_lock.release()
+
+    def write(self, rel_path, content, data=None):
+        """See write_workspace_file"""
+        digest = hashlib.sha256(content).hexdigest()
+        if _current_digest(self.workspace_path, rel_path, self.journal) == digest:
+            return False
+        if data is not None and _same_document(self.workspace_path, rel_path, data):
+            return False
+
+        file_path = resolve_write_path(self.workspace_path, rel_path)
+        replace_file_atomic(file_path, content)
+        self.journal[_key(rel_path)] = _stat_record(file_path, digest)
+        self.dirty = True
+        return True
+
+    def write_json(self, workspace_path, rel_path, data, **dump_kwargs):
+        if workspace_path != self.workspace_path:
+            raise ValueError(f"{rel_path} belongs to another workspace: {workspace_path}")
+        return self.write(rel_path, json_bytes(data, **dump_kwargs), data)
+
+
+def write_workspace_file(workspace_path, rel_path, content, data=None):
+    """Write content (bytes) to rel_path in the workspace and journal it.
+
+    Nothing is written when the file currently read for rel_path already has
+    these bytes or, if data (the document content serializes) is given, parses
+    to the same document in another layout. Returns True if the file was written.
+    Use a JournalBatch for several files.
+    """
+    with JournalBatch(workspace_path) as batch:
+        return batch.write(rel_path, content, data)
+
+
+def json_bytes(data, **dump_kwargs):
+    """Bytes json.dump(data, **dump_kwargs) writes to a "w", utf-8-sig text file"""
+    return dumps_bytes(data, **dump_kwargs)
+
+
+def write_workspace_json(workspace_path, rel_path, data, **dump_kwargs):
+    """Serialize data like the editor always did and write it if it changed"""
+    return write_workspace_file(
+        workspace_path, rel_path, json_bytes(data, **dump_kwargs), data
+    )
+
+
+def diff_workspace(workspace_path, core_dir):
+    """Relative paths of workspace files whose content differs from CORE.
+
+    Workspace hashes come from the journal and CORE hashes from the integrity
+    manifest, each trusted while the file's size and mtime still match the
+    record; only files without a valid record are read and hashed. The
+    journal is refreshed with any hash computed here.
+    """
+    journal = load_journal(workspace_path)
+    core_files = core_file_records(core_dir)
+    journal_dirty = False
+    changed = []
+
+    for rel_path in iter_workspace_files(workspace_path):
+        key = _key(rel_path)
+        workspace_file = os.path.join(workspace_path, rel_path)
+        core_file = os.path.join(core_dir, rel_path)
+
+        record = journal.get(key)
+        if not _matches(record, workspace_file):
+            record = _stat_record(workspace_file, _hash_file(workspace_file))
+            journal[key] = record
+            journal_dirty = True
+
+        if not os.path.exists(core_file):
+            changed.append(rel_path)
+            continue
+        core_record = core_files.get(key)
+        if _matches(core_record, core_file):
+            core_digest = core_record["sha256"]
+        else:
+            core_digest = _hash_file(core_file)
+
+        if record["sha256"] != core_digest:
+            changed.append(rel_path)
+
+    if journal_dirty:
+        save_journal(workspace_path, journal)
+    return changed
@@ -0,0 +1,64 @@
+import json
+import os
+
+# Workspace bookkeeping files (never exported) share this prefix
+METADATA_PREFIX = ".smpj_"
+
+# Overlay workspaces hold only the files they modified; everything else is
+# read from CORE. Workspaces without this marker are legacy full copies.
+OVERLAY_MARKER = METADATA_PREFIX + "overlay.json"
+OVERLAY_VERSION = 1
+
+
+def create_overlay_workspace(core_dir, workspace_path):
+    """Create an empty overlay workspace on top of core_dir (instant, no copy)"""
+    os.makedirs(workspace_path)
+    marker = {
+        "version": OVERLAY_VERSION,
+        # Relative, so the editor folder can be moved as a whole
+        "base": os.path.relpath(core_dir, workspace_path),
+    }
+    with open(os.path.join(workspace_path, OVERLAY_MARKER), "w", encoding="utf-8") as f:
+        json.dump(marker, f, indent=4)
+
+
+def overlay_base(workspace_path):
+    """CORE directory an overlay workspace reads through to, None for full copies"""
+    try:
+        with open(os.path.join(workspace_path, OVERLAY_MARKER), "r", encoding="utf-8") as f:
+            marker = json.load(f)
+    except FileNotFoundError:
+        return None
+    return os.path.normpath(os.path.join(workspace_path, marker["base"]))
+
+
+def is_overlay(workspace_path):
+    return os.path.isfile(os.path.join(workspace_path, OVERLAY_MARKER))
+
+
+def resolve_read_path(workspace_path, rel_path):
+    """Path to read rel_path from: the workspace copy if any, else CORE"""
+    own_path = os.path.join(workspace_path, rel_path)
+    if os.path.exists(own_path):
+        return own_path
+    base = overlay_base(workspace_path)
+    if base is None:
+        return own_path
+    return os.path.join(base, rel_path)
+
+
+def resolve_write_path(workspace_path, rel_path):
+    """Path to write rel_path to (always inside the workspace, parents created)"""
+    own_path = os.path.join(workspace_path, rel_path)
+    os.makedirs(os.path.dirname(own_path), exist_ok=True)
+    return own_path
+
+
+def iter_workspace_files(workspace_path):
+    """Relative paths of the files stored in the workspace itself (no metadata)"""
+    for current_root, _, file_list in os.walk(workspace_path):
+        for file_name in file_list:
+            if current_root == workspace_path and file_name.startswith(METADATA_PREFIX):
+                continue
+            file_path = os.path.join(current_root, file_name)
+            yield os.path.relpath(file_path, workspace_path)
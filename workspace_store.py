@@ -0,0 +1,45 @@
+import os
+import threading
+
+from json_codec import load_file
+
+
+class JsonDocumentStore:
+    """Parsed JSON documents shared by validation and the editors.
+
+    Each file is read and parsed once; the document is served again while
+    the file's mtime and size are unchanged, and re-read after any write.
+    Documents are shared: callers that modify one must copy it first.
+    """
+
+    def __init__(self):
+        self._documents = {}
+        self._lock = threading.Lock()
+        self.parsed = 0
+
+    def load(self, file_path):
+        """Parsed content of file_path (raises OSError/ValueError on errors)"""
+        key = os.path.normcase(os.path.abspath(file_path))
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._documents.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+        document = load_file(key)
+        with self._lock:
+            self._documents[key] = (signature, document)
+            self.parsed += 1
+        return document
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+
+WORKSPACE_STORE = JsonDocumentStore()
+
+
+def load_json_document(file_path):
+    return WORKSPACE_STORE.load(file_path)